@@ -5,12 +5,17 @@
 
 from __future__ import annotations
 
-import uuid
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
+from flow.domain.ids import new_id
 
-@dataclass
+# 절 인덱스(0~4: 1~5절, 5: 후렴) -> slide_mappings 키 (매 호출 str() 변환 방지)
+_VERSE_KEYS = ("0", "1", "2", "3", "4", "5")
+
+
+@dataclass(slots=True)
 class Hotspot:
     """시트 위의 핫스팟 (버튼)
     
@@ -29,14 +34,18 @@ class Hotspot:
     lyric: str = ""
     slide_index: int = -1 # 기본 매핑 (Verse 1용)
     slide_mappings: dict[str, int] = field(default_factory=dict)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     
     def get_slide_index(self, verse_index: int = 0) -> int:
         """특정 절에 매핑된 슬라이드 인덱스 반환"""
         # 1. 명시적 슬라이드 매핑 확인
-        v_key = str(verse_index)
-        if v_key in self.slide_mappings:
-            return self.slide_mappings[v_key]
+        if 0 <= verse_index < len(_VERSE_KEYS):
+            v_key = _VERSE_KEYS[verse_index]
+        else:
+            v_key = str(verse_index)
+        mapped = self.slide_mappings.get(v_key)
+        if mapped is not None:
+            return mapped
         
         # 2. Verse 1(0)인 경우 기본 slide_index 반환 (하위 호환)
         if verse_index == 0:
@@ -70,7 +79,7 @@ class Hotspot:
             x=data["x"],
             y=data["y"],
             order=data.get("order", 0),
-            lyric=data.get("lyric", ""),
+            lyric=sys.intern(data.get("lyric") or ""),
             slide_index=data.get("slide_index", -1),
             slide_mappings=data.get("slide_mappings", {}),
         )
@@ -0,0 +1,10 @@
+"""도메인 엔티티 식별자 생성"""
+
+from __future__ import annotations
+
+import uuid
+
+
+def new_id() -> str:
+    """새 고유 식별자 (하이픈 없는 32자리 hex 문자열)"""
+    return uuid.uuid4().hex
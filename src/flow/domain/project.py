@@ -5,14 +5,14 @@
 
 from __future__ import annotations
 
-import uuid
 from dataclasses import dataclass, field
 from typing import Any
 
+from flow.domain.ids import new_id
 from flow.domain.score_sheet import ScoreSheet
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """프로젝트 (예배 세션)
     
@@ -28,39 +28,43 @@ class Project:
     score_sheets: list[ScoreSheet] = field(default_factory=list)
     current_sheet_index: int = 0
     current_verse_index: int = 0 # 0=1절, 1=2절, 2=3절, 3=4절, 4=5절, 5=후렴
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
+    _sheet_by_id: dict[str, ScoreSheet] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        self._sheet_by_id = {s.id: s for s in self.score_sheets}
     
     def add_score_sheet(self, sheet: ScoreSheet) -> None:
         """시트 추가"""
         self.score_sheets.append(sheet)
+        self._sheet_by_id[sheet.id] = sheet
     
     def remove_score_sheet(self, sheet_id: str) -> bool:
         """시트 제거"""
-        for i, s in enumerate(self.score_sheets):
-            if s.id == sheet_id:
-                self.score_sheets.pop(i)
-                # 현재 인덱스 조정
-                if self.current_sheet_index >= len(self.score_sheets):
-                    self.current_sheet_index = max(0, len(self.score_sheets) - 1)
-                return True
-        return False
+        sheet = self._sheet_by_id.pop(sheet_id, None)
+        if sheet is None:
+            return False
+        self.score_sheets.remove(sheet)
+        # 현재 인덱스 조정
+        if self.current_sheet_index >= len(self.score_sheets):
+            self.current_sheet_index = max(0, len(self.score_sheets) - 1)
+        return True
     
     def find_score_sheet_by_id(self, sheet_id: str) -> ScoreSheet | None:
         """ID로 시트 찾기"""
-        for s in self.score_sheets:
-            if s.id == sheet_id:
-                return s
-        return None
+        return self._sheet_by_id.get(sheet_id)
     
     def move_score_sheet(self, sheet_id: str, new_index: int) -> bool:
         """시트 순서 변경"""
-        for i, s in enumerate(self.score_sheets):
-            if s.id == sheet_id:
-                sheet = self.score_sheets.pop(i)
-                new_index = max(0, min(new_index, len(self.score_sheets)))
-                self.score_sheets.insert(new_index, sheet)
-                return True
-        return False
+        sheet = self._sheet_by_id.get(sheet_id)
+        if sheet is None:
+            return False
+        self.score_sheets.remove(sheet)
+        new_index = max(0, min(new_index, len(self.score_sheets)))
+        self.score_sheets.insert(new_index, sheet)
+        return True
     
     def get_current_score_sheet(self) -> ScoreSheet | None:
         """현재 시트 반환"""
@@ -96,7 +100,7 @@ class Project:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Project:
         """딕셔너리에서 생성 (JSON 역직렬화용)"""
-        score_sheets = [ScoreSheet.from_dict(s) for s in data.get("score_sheets", [])]
+        score_sheets = list(map(ScoreSheet.from_dict, data.get("score_sheets", ())))
         return cls(
             id=data["id"],
             name=data["name"],
@@ -5,14 +5,19 @@
 
 from __future__ import annotations
 
-import uuid
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
 from flow.domain.hotspot import Hotspot
+from flow.domain.ids import new_id
 
 
-@dataclass
+def _order_key(hotspot: Hotspot) -> int:
+    return hotspot.order
+
+
+@dataclass(slots=True)
 class ScoreSheet:
     """시트 (슬라이드 그룹)
     
@@ -27,66 +32,71 @@ class ScoreSheet:
     image_path: str = ""
     pptx_path: str = ""
     hotspots: list[Hotspot] = field(default_factory=list)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
+    _position_by_id: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        # hotspots는 항상 order 기준으로 정렬되어 있고, order == 리스트 위치를 유지함
+        self.hotspots.sort(key=_order_key)
+        self._reindex()
+    
+    def _reindex(self, start: int = 0) -> None:
+        """start 위치부터 order 번호와 id -> 위치 인덱스를 다시 매김"""
+        hotspots = self.hotspots
+        positions = self._position_by_id
+        for i in range(start, len(hotspots)):
+            h = hotspots[i]
+            h.order = i
+            positions[h.id] = i
     
     def add_hotspot(self, hotspot: Hotspot, index: int | None = None) -> None:
         """핫스팟 추가 및 순서 재배치"""
         if index is None:
             # 맨 뒤에 추가
-            hotspot.order = len(self.hotspots)
-            self.hotspots.append(hotspot)
+            index = len(self.hotspots)
         else:
             # 특정 위치에 삽입 (기존 것들은 뒤로 밀림)
-            hotspot.order = index
-            for h in self.hotspots:
-                if h.order >= index:
-                    h.order += 1
-            self.hotspots.append(hotspot)
+            index = max(0, min(index, len(self.hotspots)))
+        
+        self.hotspots.insert(index, hotspot)
+        self._reindex(index)
         
     def remove_hotspot(self, hotspot_id: str) -> bool:
         """핫스팟 제거 및 순서 재배치"""
-        removed_order = -1
-        target_idx = -1
-        for i, h in enumerate(self.hotspots):
-            if h.id == hotspot_id:
-                removed_order = h.order
-                target_idx = i
-                break
+        pos = self._position_by_id.pop(hotspot_id, None)
+        if pos is None:
+            return False
         
-        if target_idx != -1:
-            self.hotspots.pop(target_idx)
-            # 순서 재정렬 (빈자리 채우기)
-            for h in self.hotspots:
-                if h.order > removed_order:
-                    h.order -= 1
-            return True
-        return False
+        self.hotspots.pop(pos)
+        # 순서 재정렬 (빈자리 채우기)
+        self._reindex(pos)
+        return True
     
     def find_hotspot_by_id(self, hotspot_id: str) -> Hotspot | None:
         """ID로 핫스팟 찾기"""
-        for h in self.hotspots:
-            if h.id == hotspot_id:
-                return h
-        return None
+        pos = self._position_by_id.get(hotspot_id)
+        if pos is None:
+            return None
+        return self.hotspots[pos]
     
     def get_ordered_hotspots(self) -> list[Hotspot]:
-        """순서대로 정렬된 핫스팟 목록 반환"""
-        return sorted(self.hotspots, key=lambda h: h.order)
+        """순서대로 정렬된 핫스팟 목록 반환 (hotspots는 이미 정렬 상태)"""
+        return list(self.hotspots)
     
     def get_next_hotspot(self, current_id: str) -> Hotspot | None:
         """다음 핫스팟 반환"""
-        ordered = self.get_ordered_hotspots()
-        for i, h in enumerate(ordered):
-            if h.id == current_id and i + 1 < len(ordered):
-                return ordered[i + 1]
+        pos = self._position_by_id.get(current_id)
+        if pos is not None and pos + 1 < len(self.hotspots):
+            return self.hotspots[pos + 1]
         return None
     
     def get_previous_hotspot(self, current_id: str) -> Hotspot | None:
         """이전 핫스팟 반환"""
-        ordered = self.get_ordered_hotspots()
-        for i, h in enumerate(ordered):
-            if h.id == current_id and i > 0:
-                return ordered[i - 1]
+        pos = self._position_by_id.get(current_id)
+        if pos is not None and pos > 0:
+            return self.hotspots[pos - 1]
         return None
     
     def to_dict(self) -> dict[str, Any]:
@@ -102,11 +112,11 @@ class ScoreSheet:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ScoreSheet:
         """딕셔너리에서 생성 (JSON 역직렬화용)"""
-        hotspots = [Hotspot.from_dict(h) for h in data.get("hotspots", [])]
+        hotspots = list(map(Hotspot.from_dict, data.get("hotspots", ())))
         return cls(
             id=data["id"],
-            name=data["name"],
-            image_path=data.get("image_path", ""),
-            pptx_path=data.get("pptx_path", ""),
+            name=sys.intern(data["name"] or ""),
+            image_path=sys.intern(data.get("image_path") or ""),
+            pptx_path=sys.intern(data.get("pptx_path") or ""),
             hotspots=hotspots,
         )
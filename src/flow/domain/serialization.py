@@ -0,0 +1,38 @@
+"""JSON 직렬화 헬퍼
+
+도메인 모델의 to_dict() 결과를 바이트로 변환/복원.
+orjson이 있으면 사용하고, 없으면 표준 json 모듈로 대체함.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+_BOM = b"\xef\xbb\xbf"
+
+
+def dumps(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 변환 (들여쓰기 2칸)"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """JSON 바이트/문자열을 파이썬 객체로 변환 (UTF-8 BOM 허용)"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if data.startswith(_BOM):
+        data = data[len(_BOM):]
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
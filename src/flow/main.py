@@ -6,6 +6,10 @@ import signal
 
 def main() -> int:
     """애플리케이션 메인 함수"""
+    # 슬라이드 렌더링 프로세스 풀이 패키징된 실행 파일에서도 동작하도록 설정
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     # PySide6 임포트는 여기서 수행 (테스트 시 GUI 의존성 분리)
     from PySide6.QtWidgets import QApplication, QSplashScreen
     from PySide6.QtGui import QPixmap
@@ -5,12 +5,19 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import os
+import time
 from pathlib import Path
 from typing import Any
 
+from flow.domain import serialization
 from flow.domain.project import Project
 
+# 폴더 수정 시각이 스캔 시점과 이 간격 안이면 캐시를 믿지 않음
+# (FAT/exFAT는 2초 단위로 기록되어, 같은 틱에 추가된 파일은 시각이 바뀌지 않을 수 있음)
+_MTIME_GRANULARITY_NS = 2_000_000_000
+
 
 class ProjectRepository:
     """프로젝트 저장소
@@ -23,6 +30,8 @@ class ProjectRepository:
     
     def __init__(self, base_path: Path | str) -> None:
         self.base_path = Path(base_path)
+        # list_projects 결과 캐시: (폴더 mtime_ns, 스캔 시각 ns, 파일 목록)
+        self._listing: tuple[int, int, list[Path]] | None = None
     
     def save(self, project: Project, file_path: Path | str | None = None) -> Path:
         """프로젝트 저장 (상대 경로 변환 포함)"""
@@ -33,81 +42,122 @@ class ProjectRepository:
             self.base_path.mkdir(parents=True, exist_ok=True)
             file_path = (self.base_path / f"{project.id}.json").resolve()
         
-        project_dir = file_path.parent
+        # 기준 폴더 접두사("<project_dir>/")는 한 번만 계산해 모든 경로에 재사용
+        base_prefix = os.path.join(str(file_path.parent), "")
         
         # 딕셔너리 변환 시 경로들을 상대 경로로 시도
         data = project.to_dict()
         
         # PPT 경로 처리
         if data.get("pptx_path"):
-            data["pptx_path"] = self._try_make_relative(data["pptx_path"], project_dir)
+            data["pptx_path"] = self._try_make_relative(data["pptx_path"], base_prefix)
             
         # 각 악보 이미지 경로 처리
         for sheet_data in data.get("score_sheets", []):
             if sheet_data.get("image_path"):
-                sheet_data["image_path"] = self._try_make_relative(sheet_data["image_path"], project_dir)
+                sheet_data["image_path"] = self._try_make_relative(sheet_data["image_path"], base_prefix)
         
-        with open(file_path, "w", encoding="utf-8-sig") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        self._write_atomic(file_path, serialization.dumps(data))
+        self._listing = None
         
         return file_path
     
-    def _try_make_relative(self, path_str: str, base_dir: Path) -> str:
-        """경로를 기준 디렉토리에 대한 상대 경로로 변환 시도"""
+    def _write_atomic(self, file_path: Path, data: bytes) -> None:
+        """임시 파일에 한 번에 쓴 뒤 교체 (저장 중 중단되어도 기존 파일 보존)"""
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _try_make_relative(self, path_str: str, base_prefix: str) -> str:
+        """경로를 기준 디렉토리에 대한 상대 경로로 변환 시도
+        
+        Args:
+            path_str: 변환할 경로
+            base_prefix: 구분자로 끝나는 기준 디렉토리 절대 경로
+        """
+        prefix = os.path.normcase(base_prefix)
         try:
-            p = Path(path_str).resolve()
-            if base_dir in p.parents or p.parent == base_dir:
-                return str(p.relative_to(base_dir))
+            # 문자열 연산만으로 먼저 확인하고, 심볼릭 링크 등으로 어긋날 때만 실제 경로 조회
+            abs_path = os.path.abspath(path_str)
+            if not os.path.normcase(abs_path).startswith(prefix):
+                abs_path = os.path.realpath(path_str)
+                if not os.path.normcase(abs_path).startswith(prefix):
+                    return path_str
+            return abs_path[len(prefix):]
         except Exception:
-            pass
-        return path_str
+            return path_str
 
     def load(self, file_path: Path | str) -> Project:
         """프로젝트 로드 (경로 복구 로직 포함)"""
         file_path = Path(file_path).resolve()
-        project_dir = file_path.parent
+        project_dir = str(file_path.parent)
         
-        with open(file_path, "r", encoding="utf-8-sig") as f:
-            data = json.load(f)
+        # BOM이 붙은 이전 버전 파일도 그대로 읽힘
+        data = serialization.loads(file_path.read_bytes())
             
         # 1. 딕셔너리 데이터의 상대 경로들을 절대 경로로 복구
+        # 같은 경로가 여러 번 나오면 파일 시스템 조회 없이 재사용 (로드 1회 한정 캐시)
+        resolve = functools.lru_cache(maxsize=None)(
+            lambda path_str: self._resolve_path(path_str, project_dir)
+        )
+        
         if data.get("pptx_path"):
-            data["pptx_path"] = self._resolve_path(data["pptx_path"], project_dir)
+            data["pptx_path"] = resolve(data["pptx_path"])
             
         for sheet_data in data.get("score_sheets", []):
             if sheet_data.get("image_path"):
-                sheet_data["image_path"] = self._resolve_path(sheet_data["image_path"], project_dir)
+                sheet_data["image_path"] = resolve(sheet_data["image_path"])
         
         return Project.from_dict(data)
 
-    def _resolve_path(self, path_str: str, project_dir: Path) -> str:
+    def _resolve_path(self, path_str: str, project_dir: str) -> str:
         """상대 경로를 절대 경로로 복구하고, 파일이 없으면 주변 검색 시도"""
-        p = Path(path_str)
-        
-        # 이미 절대 경로로 존재하면 그대로 유지
-        if p.is_absolute() and p.exists():
-            return str(p)
+        # 이미 절대 경로로 존재하면 그대로 유지 (stat 한 번으로 확인)
+        if os.path.isabs(path_str):
+            try:
+                os.stat(path_str)
+                return os.path.normpath(path_str)
+            except OSError:
+                pass
             
         # 1. 상대 경로인 경우 프로젝트 폴더 기반 확인
-        abs_p = (project_dir / p).resolve()
-        if abs_p.exists():
-            return str(abs_p)
+        abs_path = os.path.normpath(os.path.join(project_dir, path_str))
+        if os.path.exists(abs_path):
+            return abs_path
             
         # 2. 파일이 이동된 경우: 프로젝트 폴더 내에서 파일명만으로 검색 (Fallback)
-        filename = p.name
-        fallback_p = project_dir / filename
-        if fallback_p.exists():
-            return str(fallback_p)
+        fallback_path = os.path.join(project_dir, os.path.basename(path_str))
+        if os.path.exists(fallback_path):
+            return fallback_path
             
         # 3. 그래도 없으면 원래 경로 반환 (UI에서 '찾을 수 없음' 표시용)
-        return str(p)
+        return str(Path(path_str))
     
     def list_projects(self) -> list[Path]:
         """저장된 프로젝트 파일 목록 반환"""
-        if not self.base_path.exists():
+        try:
+            dir_mtime = os.stat(self.base_path).st_mtime_ns
+        except FileNotFoundError:
             return []
         
-        return list(self.base_path.glob("*.json"))
+        # 폴더 내용이 바뀌지 않았으면 이전 스캔 결과 재사용
+        # (스캔 직전에 바뀐 폴더는 시각 해상도가 거친 파일 시스템일 수 있어 다시 스캔)
+        listing = self._listing
+        if (listing is None or listing[0] != dir_mtime
+                or dir_mtime >= listing[1] - _MTIME_GRANULARITY_NS):
+            scanned_ns = time.time_ns()
+            with os.scandir(self.base_path) as it:
+                files = [
+                    Path(entry.path) for entry in it
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+            self._listing = (dir_mtime, scanned_ns, files)
+        
+        return list(self._listing[2])
     
     def delete(self, file_path: Path | str) -> bool:
         """프로젝트 파일 삭제
@@ -119,5 +169,6 @@ class ProjectRepository:
         
         if file_path.exists():
             file_path.unlink()
+            self._listing = None
             return True
         return False
@@ -1,7 +1,8 @@
-import json
 from pathlib import Path
 import os
 
+from flow.domain import serialization
+
 class ConfigService:
     """애플리케이션 설정 관리 (최근 프로젝트 등)"""
     
@@ -11,24 +12,36 @@ class ConfigService:
         self._config = {
             "recent_projects": []
         }
+        # 마지막으로 읽은 설정 파일의 (경로, mtime_ns) - 변경이 없으면 다시 읽지 않음
+        self._config_stamp: tuple[str, int] | None = None
         self.load()
 
     def load(self):
-        """설정 파일 로드"""
-        if self._config_file.exists():
-            try:
-                with open(self._config_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._config.update(data)
-            except Exception as e:
-                print(f"[Config] 설정 로드 실패: {e}")
+        """설정 파일 로드 (마지막 로드 이후 변경된 경우에만 다시 읽음)"""
+        config_path = str(self._config_file)
+        try:
+            stamp = (config_path, os.stat(config_path).st_mtime_ns)
+        except OSError:
+            return
+        if stamp == self._config_stamp:
+            return
+        try:
+            with open(config_path, "rb") as f:
+                data = serialization.loads(f.read())
+            self._config.update(data)
+            self._config_stamp = stamp
+        except Exception as e:
+            print(f"[Config] 설정 로드 실패: {e}")
 
     def save(self):
         """설정 파일 저장"""
         self._config_dir.mkdir(parents=True, exist_ok=True)
         try:
-            with open(self._config_file, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=4, ensure_ascii=False)
+            with open(self._config_file, "wb") as f:
+                f.write(serialization.dumps(self._config))
+            # 방금 쓴 내용은 이미 메모리에 있으므로 다음 load()에서 다시 읽지 않음
+            config_path = str(self._config_file)
+            self._config_stamp = (config_path, os.stat(config_path).st_mtime_ns)
         except Exception as e:
             print(f"[Config] 설정 저장 실패: {e}")
 
@@ -38,7 +51,8 @@ class ConfigService:
         recent = self._config.get("recent_projects", [])
         # 노출할 때는 존재하는 것만 리턴하되, 원본 데이터(self._config)는 보존하여 
         # 일시적인 네트워크 드라이브 단절 등으로 인한 데이터 유실 방지
-        valid_recent = [p for p in recent if Path(p).exists()]
+        exists = os.path.exists
+        valid_recent = [p for p in recent if exists(p)]
         return valid_recent
 
     def add_recent_project(self, path: str):
@@ -51,22 +65,19 @@ class ConfigService:
         clean_path = str(path).replace("\\", "/")
         
         # 2. 절대 경로화 및 표준 포맷(POSIX) 변환
-        try:
-            path_obj = Path(clean_path).resolve()
-            path_str = path_obj.as_posix()
-        except Exception:
-            path_str = clean_path
-            path_obj = Path(path_str)
+        # (심볼릭 링크도 실제 경로로 풀어 같은 프로젝트가 두 번 등록되지 않도록 함)
+        path_str = os.path.realpath(clean_path).replace("\\", "/")
             
         # 3. 파일이 실제로 존재할 때만 추가
-        if not path_obj.exists():
+        if not os.path.isfile(path_str):
             return
 
         self.load() # 다른 인스턴스에서 추가했을 수 있으므로 먼저 로드
         recent = self._config.get("recent_projects", [])
         
         # 중복 제거 (대소문자 구분 없이 체크하여 윈도우/리눅스 포괄 대응)
-        cleaned_recent = [p for p in recent if p.lower() != path_str.lower()]
+        target = path_str.lower()
+        cleaned_recent = [p for p in recent if p.lower() != target]
         
         # 목록 맨 앞에 추가
         cleaned_recent.insert(0, path_str)
@@ -81,7 +92,8 @@ class ConfigService:
         recent = self._config.get("recent_projects", [])
         
         # 대소문자 구분 없이 제거
-        new_recent = [p for p in recent if p.lower() != path.lower()]
+        target = path.lower()
+        new_recent = [p for p in recent if p.lower() != target]
         
         if len(new_recent) != len(recent):
             self._config["recent_projects"] = new_recent
@@ -0,0 +1,55 @@
+"""PDF 페이지 렌더링 헬퍼
+
+Qt를 import하지 않으므로 spawn 방식 워커 프로세스에서도 가볍게 불러올 수 있음
+"""
+
+import os
+
+import fitz  # PyMuPDF
+
+# 렌더링 배율 범위 (2.0배 = 약 144 DPI, 2K급 선명도)
+MIN_ZOOM = 1.0
+MAX_ZOOM = 2.0
+
+# 이 페이지 수마다 MuPDF 내부 캐시(글꼴/이미지)를 비워 큰 덱의 메모리 증가 억제
+_STORE_SHRINK_EVERY = 16
+
+
+def page_zoom(page, target_size: tuple[int, int] | None) -> float:
+    """표시 영역에 딱 맞는 배율 계산 (작은 화면용으로 과하게 큰 이미지를 만들지 않음)"""
+    if target_size is None:
+        return MAX_ZOOM
+    rect = page.rect
+    if rect.width <= 0 or rect.height <= 0:
+        return MAX_ZOOM
+    zoom = min(target_size[0] / rect.width, target_size[1] / rect.height)
+    return max(MIN_ZOOM, min(MAX_ZOOM, zoom))
+
+
+def shrink_store(index: int) -> None:
+    """일정 페이지마다 MuPDF 내부 캐시 비우기"""
+    if index % _STORE_SHRINK_EVERY == _STORE_SHRINK_EVERY - 1:
+        fitz.TOOLS.store_shrink(100)
+
+
+def render_page(doc, index: int, cache_dir: str,
+                target_size: tuple[int, int] | None = None) -> None:
+    """PDF 한 페이지를 slide_{index}.png로 저장"""
+    page = doc.load_page(index)
+    zoom = page_zoom(page, target_size)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    img_path = os.path.join(cache_dir, f"slide_{index}.png")
+    # 메모리에서 한 번에 인코딩한 뒤 버퍼 없이 한 번의 write로 저장
+    data = pix.tobytes("png")
+    with open(img_path, "wb", buffering=0) as f:
+        f.write(data)
+
+
+def render_page_range(pdf_path: str, cache_dir: str, start: int, stop: int,
+                      target_size: tuple[int, int] | None = None) -> int:
+    """[start, stop) 범위 페이지 렌더링 (워커 프로세스에서 문서를 따로 열어 사용)"""
+    with fitz.open(pdf_path) as doc:
+        for i in range(start, stop):
+            render_page(doc, i, cache_dir, target_size=target_size)
+            shrink_store(i - start)
+    return stop - start
@@ -1,45 +1,358 @@
 """SlideConverter - 플랫폼별 PPTX 슬라이드 이미지 변환 인터페이스"""
 
 import abc
+import atexit
+import functools
+import hashlib
+import multiprocessing
 import os
+import queue
+import shutil
+import struct
 import subprocess
 import tempfile
-import shutil
-import hashlib
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from PySide6.QtGui import QImage
+
 import fitz  # PyMuPDF
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+from flow.services.pdf_render import render_page, render_page_range, shrink_store
+
+try:
+    import xxhash
+except ImportError:  # xxhash 미설치 시 blake2b 사용
+    xxhash = None
+
+# 변환 실패/경로 없음 시 반환하는 검은 화면
+# (모든 호출이 공유, 쓰기 시 Qt가 자동으로 복사)
+_FALLBACK_IMAGE = QImage(1280, 720, QImage.Format.Format_RGB32)
+_FALLBACK_IMAGE.fill(Qt.GlobalColor.black)
 
 class SlideConverter(abc.ABC):
     """PPTX 슬라이드를 이미지로 변환하는 추상 베이스 클래스"""
-    
+
+    # 슬라이드를 표시할 최대 크기 (픽셀, None이면 기본 배율로 렌더링)
+    _target_size: tuple[int, int] | None = None
+
     @abc.abstractmethod
     def get_engine_name(self) -> str:
         """현재 사용 중인 엔진의 이름을 반환"""
         pass
 
+    def set_target_size(self, width: int, height: int) -> None:
+        """렌더링 해상도 기준이 될 표시 영역 크기 설정"""
+        self._target_size = (width, height) if width > 0 and height > 0 else None
+
+# 이번 세션에서 이미 만든 캐시 폴더 (반복 mkdir 시스템 콜 생략)
+_known_dirs: set[str] = set()
+
+def _ensure_dir(dir_path: str) -> None:
+    """캐시 폴더가 없으면 생성"""
+    if dir_path not in _known_dirs:
+        os.makedirs(dir_path, exist_ok=True)
+        _known_dirs.add(dir_path)
+
+# 이 기간 동안 사용되지 않은 덱 캐시 폴더는 정리
+_CACHE_MAX_AGE_SEC = 30 * 24 * 60 * 60
+
+# ZIP 끝 레코드(EOCD): 고정 22바이트 + 최대 65535바이트 주석
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_SIZE = 22
+_EOCD_SEARCH = _EOCD_SIZE + 0xFFFF
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_ZIP64_LOCATOR_SIZE = 20
+
+def _central_directory_range(f, size: int) -> tuple[int, int] | None:
+    """ZIP 중앙 디렉토리의 (시작 위치, 길이) (ZIP이 아니면 None)"""
+    tail_start = max(0, size - _EOCD_SEARCH)
+    f.seek(tail_start)
+    tail = f.read()
+    pos = tail.rfind(_EOCD_SIGNATURE)
+    if pos < 0 or pos + _EOCD_SIZE > len(tail):
+        return None
+    cd_size, cd_offset = struct.unpack_from("<II", tail, pos + 12)
+    if cd_size == 0xFFFFFFFF or cd_offset == 0xFFFFFFFF:
+        # ZIP64: EOCD 바로 앞 로케이터가 가리키는 ZIP64 끝 레코드에서 읽음
+        loc = pos - _ZIP64_LOCATOR_SIZE
+        if loc < 0 or tail[loc:loc + 4] != _ZIP64_LOCATOR_SIGNATURE:
+            return None
+        (record_offset,) = struct.unpack_from("<Q", tail, loc + 8)
+        f.seek(record_offset)
+        record = f.read(56)
+        if len(record) < 56:
+            return None
+        cd_size, cd_offset = struct.unpack_from("<QQ", record, 40)
+    if cd_offset + cd_size > size:
+        return None
+    return cd_offset, cd_size
+
+def content_signature(path: Path | str) -> tuple[int, bytes] | None:
+    """파일 크기 + ZIP 중앙 디렉토리 전체의 해시 (읽기 실패 시 None)
+
+    PPTX(ZIP)의 중앙 디렉토리에는 모든 파트의 CRC와 크기가 들어 있어,
+    내용이 바뀌면 반드시 달라짐. 저장 시각만 바뀐 경우는 같은 값.
+    ZIP 구조를 찾지 못하면 파일 전체를 해시함
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            size = f.seek(0, 2)
+            cd_range = _central_directory_range(f, size)
+            if cd_range is not None:
+                f.seek(cd_range[0])
+                digest.update(f.read(cd_range[1]))
+            else:
+                f.seek(0)
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+    except (OSError, struct.error):
+        return None
+    return size, digest.digest()
+
+@functools.lru_cache(maxsize=64)
+def _deck_hash(prefix: str, resolved_path: str, mtime_ns: int, size: int) -> str:
+    """덱별 캐시 폴더 이름 (내용이 바뀌면 다른 이름이 되어 자동 무효화)
+
+    수정 시각은 메모 갱신용으로만 쓰고 이름은 내용 서명으로 만들어,
+    내용 없이 저장 시각만 바뀐 경우 기존 렌더링 결과를 그대로 사용
+    (파일 감시의 변경 판별과 같은 기준)
+    """
+    signature = content_signature(resolved_path)
+    content = signature[1].hex() if signature is not None else str(mtime_ns)
+    key = f"{prefix}:{resolved_path}:{content}:{size}".encode()
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(key)
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+@functools.lru_cache(maxsize=64)
+def _resolve_deck_path(path_str: str) -> str:
+    """PPTX 절대 경로 (슬라이드마다 resolve() 시스템 콜을 반복하지 않도록 캐시)"""
+    return str(Path(path_str).resolve())
+
+def _deck_key(prefix: str, pptx_path: Path,
+              target_size: tuple[int, int] | None = None) -> str:
+    """PPTX 파일의 현재 상태(경로, 내용, 크기)와 렌더링 크기에 해당하는 캐시 키
+
+    작은 화면용으로 낮은 배율로 렌더링한 덱을 큰 화면에서 재사용하지 않도록
+    표시 영역 크기도 키에 포함
+    """
+    if target_size is not None:
+        prefix = f"{prefix}@{target_size[0]}x{target_size[1]}"
+    path_str = str(pptx_path)
+    st = os.stat(path_str)
+    return _deck_hash(
+        prefix, _resolve_deck_path(path_str), st.st_mtime_ns, st.st_size
+    )
+
+# 존재가 확인된 슬라이드 PNG 경로 (캐시 적중 시 stat 생략)
+_known_images: set[str] = set()
+
+def _slide_exists(img_path: str) -> bool:
+    """캐시된 슬라이드 PNG가 있는지 확인"""
+    if img_path in _known_images:
+        return True
+    if os.path.exists(img_path):
+        _known_images.add(img_path)
+        return True
+    return False
+
+def invalidate_deck_cache() -> None:
+    """PPTX 파일 변경 시 경로/존재 여부 캐시 초기화"""
+    _resolve_deck_path.cache_clear()
+    _known_images.clear()
+    _known_dirs.clear()
+
+# 이번 세션에서 사용 시각을 갱신한 덱 캐시 폴더
+_touched_decks: set[str] = set()
+
+def _touch_deck(deck_dir: str) -> None:
+    """덱 캐시 폴더의 수정 시각을 지금으로 갱신 (세션당 한 번)
+
+    정리 기준이 처음 렌더링한 시각이 아니라 마지막으로 사용한 시각이 되도록 함
+    """
+    if deck_dir in _touched_decks:
+        return
+    try:
+        os.utime(deck_dir)
+    except OSError:
+        return  # 아직 만들어지지 않은 폴더 (변환하면서 생성되므로 시각도 새로 기록됨)
+    _touched_decks.add(deck_dir)
+
+@functools.lru_cache(maxsize=None)
+def _prune_stale_caches(cache_dir: Path) -> None:
+    """오래 사용하지 않은 덱 캐시 폴더 삭제 (프로세스당 한 번)
+
+    수정 전 버전의 PPTX 렌더링 결과 등이 대상
+    """
+    cutoff = time.time() - _CACHE_MAX_AGE_SEC
+    try:
+        with os.scandir(cache_dir) as it:
+            stale = [e.path for e in it if e.is_dir() and e.stat().st_mtime < cutoff]
+    except OSError:
+        return
+    for path in stale:
+        _known_dirs.discard(path)
+        _touched_decks.discard(path)
+        prefix = os.path.join(path, "")
+        _known_images.difference_update(
+            [p for p in tuple(_known_images) if p.startswith(prefix)]
+        )
+        shutil.rmtree(path, ignore_errors=True)
+
+def _load_image(img_path: str) -> QImage | None:
+    """캐시된 PNG를 QImage로 로드 (없거나 읽을 수 없으면 None)
+
+    임시 폴더 정리 등으로 메모해 둔 파일이 사라졌으면 메모를 버려
+    호출자가 다시 변환하도록 함 (메모리 캐시는 SlideManager가 담당)
+    """
+    if not _slide_exists(img_path):
+        return None
+    image = QImage(img_path)
+    if image.isNull():
+        _known_images.discard(img_path)
+        _known_dirs.discard(os.path.dirname(img_path))
+        return None
+    return image
+
+def is_fallback_image(image) -> bool:
+    """변환 실패 결과(공용 검은 화면 또는 빈 이미지)인지 확인"""
+    return image is _FALLBACK_IMAGE or (isinstance(image, QImage) and image.isNull())
+
+# 진행 중인 덱 변환 (캐시 폴더 -> 완료 Future)
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+def _single_flight(key: str, work) -> None:
+    """같은 덱의 변환이 이미 진행 중이면 새로 시작하지 않고 끝날 때까지 대기"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    if not owner:
+        # 결과는 캐시 폴더에 있으므로 완료만 기다림 (실패 처리는 최초 호출자가 담당)
+        wait([future])
+        return
+    try:
+        work()
+        future.set_result(None)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+def _run_converter(cmd: list[str]) -> None:
+    """외부 변환 프로그램 실행
+
+    출력은 버리고, 실패 시에만 stderr를 디코딩해 예외에 포함
+    """
+    try:
+        subprocess.run(
+            cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+    except subprocess.CalledProcessError as e:
+        detail = (e.stderr or b"").decode(errors="replace").strip()
+        raise RuntimeError(f"{e} {detail}".rstrip()) from e
+
 def _get_project_root() -> Path:
     """프로젝트 루트 디렉토리 반환"""
     return Path(__file__).parent.parent.parent.parent
 
-def _convert_pdf_to_images(pdf_path: Path, cache_dir: Path) -> bool:
+# 페이지 수가 이보다 많으면 프로세스 풀로 나눠 렌더링
+# (PyMuPDF는 렌더링 중 GIL을 놓지 않아 스레드로는 병렬화되지 않음)
+_PARALLEL_MIN_PAGES = 8
+
+# 렌더링 워커 프로세스 풀 (첫 병렬 렌더링 때 만들어 덱마다 재사용)
+# spawn 방식: Qt 스레드가 떠 있는 프로세스를 fork하면 교착될 수 있음
+_render_pool: ProcessPoolExecutor | None = None
+_render_pool_lock = threading.Lock()
+
+# 워커마다 PyMuPDF를 따로 불러 상주하므로 코어 수와 관계없이 개수를 제한
+_MAX_RENDER_WORKERS = 4
+
+def _render_workers() -> int:
+    return min(_MAX_RENDER_WORKERS, os.cpu_count() or 1)
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(
+                max_workers=_render_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _render_pool
+
+@atexit.register
+def _shutdown_render_pool() -> None:
+    """앱 종료 시 워커 프로세스 정리"""
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _render_pages_parallel(pdf_path: str, cache_dir: str, page_count: int,
+                           target_size: tuple[int, int] | None = None) -> None:
+    """페이지를 워커 수만큼 구간으로 나눠 프로세스 풀에서 렌더링"""
+    global _render_pool
+    workers = min(_render_workers(), page_count)
+    chunk = -(-page_count // workers)
+    pool = _get_render_pool()
+    futures = [
+        pool.submit(
+            render_page_range, pdf_path, cache_dir,
+            start, min(start + chunk, page_count), target_size,
+        )
+        for start in range(0, page_count, chunk)
+    ]
+    try:
+        for future in as_completed(futures):
+            future.result()
+    except BrokenProcessPool:
+        # 워커가 죽은 풀은 재사용할 수 없으므로 다음 요청 때 새로 만듦
+        with _render_pool_lock:
+            if _render_pool is pool:
+                _render_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+def _convert_pdf_to_images(pdf_path: Path, cache_dir: Path,
+                           target_size: tuple[int, int] | None = None) -> bool:
     """PDF의 모든 페이지를 고화질 PNG로 변환하여 캐시 디렉토리에 저장"""
     if not pdf_path.exists() or pdf_path.stat().st_size == 0:
         return False
-        
+
+    pdf_str = str(pdf_path)
+    cache_dir_str = str(cache_dir)
     try:
         # with 문을 사용하여 문서가 자동으로 닫히도록 관리
-        with fitz.open(str(pdf_path)) as doc:
+        with fitz.open(pdf_str) as doc:
             page_count = len(doc)
-            if page_count == 0: return False
-            
+            if page_count == 0:
+                return False
+
+            if page_count > _PARALLEL_MIN_PAGES and _render_workers() > 1:
+                try:
+                    _render_pages_parallel(
+                        pdf_str, cache_dir_str, page_count, target_size
+                    )
+                    return True
+                except Exception as e:
+                    # 프로세스 풀을 쓸 수 없는 환경이면 순차 렌더링으로 진행
+                    print(f"[SlideConverter] 병렬 렌더링 실패, 순차 처리로 전환: {e}")
+
             for i in range(page_count):
-                page = doc.load_page(i)
-                # 2.0배 배율 (약 144 DPI) - 2K급 선명도 (속도와 화질의 균형)
-                pix = page.get_pixmap(matrix=fitz.Matrix(2.0, 2.0))
-                target = cache_dir / f"slide_{i}.png"
-                pix.save(str(target))
-            
+                render_page(doc, i, cache_dir_str, target_size=target_size)
+                shrink_store(i)
+
         return True
     except Exception as e:
         # 가끔 subprocess 종료 직후 파일이 잠겨있을 수 있음
@@ -49,78 +362,113 @@ def _convert_pdf_to_images(pdf_path: Path, cache_dir: Path) -> bool:
         print(f"[SlideConverter] PDF 이미지 추출 실패: {e}")
         return False
 
-import threading
+# 덱의 모든 페이지 렌더링이 끝났음을 표시하는 파일
+_RENDERED_MARKER = ".rendered"
+
+def _render_deck_once(pdf_path: Path, cache_dir: Path,
+                      target_size: tuple[int, int] | None = None) -> bool:
+    """덱 PDF를 한 번만 PNG로 렌더링 (완료 표시가 있으면 다시 렌더링하지 않음)
+
+    범위를 벗어난 슬라이드 요청 등으로 PNG가 없어도 전체 렌더링을 반복하지 않으며,
+    렌더링 도중 중단된 덱은 표시 파일이 없으므로 다음 요청 때 다시 렌더링됨
+    """
+    marker = os.path.join(str(cache_dir), _RENDERED_MARKER)
+    if os.path.exists(marker):
+        return True
+    if not _convert_pdf_to_images(pdf_path, cache_dir, target_size):
+        return False
+    with open(marker, "wb") as f:
+        f.write(b"1")
+    return True
 
 class OnlyOfficeSlideConverter(SlideConverter):
     """ONLYOFFICE Document Builder를 사용한 독립형 변환기 (설치 불필요)"""
-    
-    _lock = threading.Lock() # 클래스 레벨 락으로 중복 변환 방지
+
+    # 덱(캐시 키)별 락: 같은 덱의 중복 변환만 막고 서로 다른 덱은 동시에 변환
+    # (threading.Lock은 약한 참조를 지원하지 않아 일반 dict 사용,
+    #  세션 중 연 덱 수만큼만 증가)
+    _locks: dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
 
     def __init__(self, executable_path: Path):
         self.exe = executable_path
         self._cache_dir = Path(tempfile.gettempdir()) / "flow_oo_cache"
         self._cache_dir.mkdir(exist_ok=True)
-        
+        _prune_stale_caches(self._cache_dir)
+        self._cache_dir_str = str(self._cache_dir)
+
     def get_engine_name(self) -> str:
         return "ONLYOFFICE (standalone)"
 
     def convert_slide(self, pptx_path: Path, index: int) -> QImage:
         if not pptx_path:
-            return QImage(1280, 720, QImage.Format.Format_RGB32)
-        mtime = pptx_path.stat().st_mtime
-        pptx_hash = hashlib.md5(f"oo_v1_{str(pptx_path.resolve())}_{mtime}".encode()).hexdigest()
-        pptx_cache_dir = self._cache_dir / pptx_hash
-        
-        img_path = pptx_cache_dir / f"slide_{index}.png"
-        if img_path.exists():
-            return QImage(str(img_path))
-
-        with self._lock:
+            return _FALLBACK_IMAGE
+        pptx_hash = _deck_key("oo_v1", pptx_path, self._target_size)
+        deck_dir = os.path.join(self._cache_dir_str, pptx_hash)
+
+        _touch_deck(deck_dir)
+        img_path = os.path.join(deck_dir, f"slide_{index}.png")
+        image = _load_image(img_path)
+        if image is not None:
+            return image
+
+        with self._locks_guard:
+            lock = self._locks.setdefault(pptx_hash, threading.Lock())
+
+        with lock:
             # 락 획득 후 다시 한번 확인 (대기하는 동안 다른 스레드가 완료했을 수 있음)
-            if img_path.exists():
-                return QImage(str(img_path))
+            image = _load_image(img_path)
+            if image is not None:
+                return image
 
-            if not pptx_cache_dir.exists():
-                pptx_cache_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(deck_dir)
+            pptx_cache_dir = Path(deck_dir)
 
             script_path = pptx_cache_dir / "convert.docbuilder"
             pdf_path = pptx_cache_dir / "temp.pdf"
-            
+
             # 폰트 경로 설정 (무거운 시스템 전체 스캔 대신 assets/fonts만 지정)
             root = _get_project_root()
             app_fonts = root / "assets" / "fonts"
             fonts_dir = str(app_fonts.resolve()).replace('\\', '/')
             tmp_dir = str(pptx_cache_dir.resolve()).replace('\\', '/')
-            
+            src_file = str(pptx_path.resolve()).replace('\\', '/')
+            pdf_file = str(pdf_path.resolve()).replace('\\', '/')
+
             script_content = f"""
             builder.SetTmpFolder("{tmp_dir}");
             builder.AddFontsDir("{fonts_dir}");
-            builder.OpenFile("{str(pptx_path.resolve()).replace('\\', '/')}");
-            builder.SaveFile("pdf", "{str(pdf_path.resolve()).replace('\\', '/')}");
+            builder.OpenFile("{src_file}");
+            builder.SaveFile("pdf", "{pdf_file}");
             builder.CloseFile();
             """
             script_path.write_text(script_content, encoding="utf-8")
 
             try:
-                subprocess.run([str(self.exe), str(script_path)], check=True, capture_output=True)
+                _run_converter([str(self.exe), str(script_path)])
                 if pdf_path.exists():
-                    _convert_pdf_to_images(pdf_path, pptx_cache_dir)
+                    _render_deck_once(pdf_path, pptx_cache_dir, self._target_size)
                 else:
-                    print(f"[OnlyOfficeSlideConverter] 슬라이드 {index} 변환 실패 (PDF 생성 안됨)")
+                    print(
+                        f"[OnlyOfficeSlideConverter] 슬라이드 {index} 변환 실패 "
+                        "(PDF 생성 안됨)"
+                    )
             except Exception as e:
                 print(f"[OnlyOfficeSlideConverter] 슬라이드 {index} 변환 실패: {e}")
 
-        if img_path.exists():
-            return QImage(str(img_path))
-        return QImage(1280, 720, QImage.Format.Format_RGB32)
+        image = _load_image(img_path)
+        if image is not None:
+            return image
+        return _FALLBACK_IMAGE
 
 class WindowsSlideConverter(SlideConverter):
     """Windows용 변환기 (PowerPoint PDF 변환 -> PyMuPDF 추출)"""
-    
+
     def __init__(self):
         self._cache_dir = Path(tempfile.gettempdir()) / "flow_win_cache"
         self._cache_dir.mkdir(exist_ok=True)
-        self._has_pp = None
+        _prune_stale_caches(self._cache_dir)
+        self._cache_dir_str = str(self._cache_dir)
 
     def get_engine_name(self) -> str:
         if self._check_powerpoint_installed():
@@ -128,153 +476,234 @@ class WindowsSlideConverter(SlideConverter):
         return "LibreOffice (installed)"
 
     def _check_powerpoint_installed(self) -> bool:
-        if self._has_pp is not None: return self._has_pp
-        try:
-            from win32com import client
-            import pythoncom
-            pythoncom.CoInitialize()
-            client.Dispatch("PowerPoint.Application")
-            self._has_pp = True
-        except: self._has_pp = False
-        return self._has_pp
+        return _powerpoint_available()
 
     def convert_slide(self, pptx_path: Path, index: int) -> QImage:
         if not pptx_path:
-            return QImage(1280, 720, QImage.Format.Format_RGB32)
-        mtime = pptx_path.stat().st_mtime
-        pptx_hash = hashlib.md5(f"win_v2_{str(pptx_path.resolve())}_{mtime}".encode()).hexdigest()
-        pptx_cache_dir = self._cache_dir / pptx_hash
-        
-        img_path = pptx_cache_dir / f"slide_{index}.png"
-        if img_path.exists():
-            return QImage(str(img_path))
+            return _FALLBACK_IMAGE
+        pptx_hash = _deck_key("win_v2", pptx_path, self._target_size)
+        deck_dir = os.path.join(self._cache_dir_str, pptx_hash)
 
+        _touch_deck(deck_dir)
+        img_path = os.path.join(deck_dir, f"slide_{index}.png")
+        image = _load_image(img_path)
+        if image is not None:
+            return image
 
-        if not pptx_cache_dir.exists():
-            pptx_cache_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(deck_dir)
 
         if self._check_powerpoint_installed():
             try:
-                self._convert_with_com_pdf(pptx_path, pptx_cache_dir)
+                # 같은 덱을 동시에 요청해도 PowerPoint 변환은 한 번만 수행
+                _single_flight(
+                    deck_dir,
+                    lambda: self._convert_with_com_pdf(pptx_path, Path(deck_dir)),
+                )
             except Exception as e:
                 print(f"[WindowsSlideConverter] 슬라이드 {index} 변환 실패: {e}")
 
-        if img_path.exists():
-            return QImage(str(img_path))
-        
+        image = _load_image(img_path)
+        if image is not None:
+            return image
+
         # Fallback to LibreOffice if available
         soffice = self._find_libreoffice()
         if soffice:
-            return _convert_with_libreoffice(pptx_path, index, self._cache_dir, soffice)
-            
-        return QImage(1280, 720, QImage.Format.Format_RGB32)
+            return _convert_with_libreoffice(
+                pptx_path, index, self._cache_dir, soffice, self._target_size
+            )
+
+        return _FALLBACK_IMAGE
 
     def _convert_with_com_pdf(self, pptx_path: Path, cache_dir: Path):
         """PowerPoint COM을 사용하여 PDF로 저장 후 이미지 추출 (고속 방식)"""
-        from win32com import client
-        import pythoncom
-        
         pdf_path = cache_dir / "temp.pdf"
         if pdf_path.exists() and (cache_dir / "slide_0.png").exists():
             return
 
-        pythoncom.CoInitialize()
-        pp = client.Dispatch("PowerPoint.Application")
-        # WithWindow=False로 백그라운드 실행
-        pres = pp.Presentations.Open(str(pptx_path.resolve()), WithWindow=False, ReadOnly=True)
-        try:
-            # 32 = ppSaveAsPDF
-            pres.SaveAs(str(pdf_path.resolve()), 32)
-            pres.Close()
-            _convert_pdf_to_images(pdf_path, cache_dir)
-        finally:
-            # 파워포인트가 다른 창에서 열려있지 않다면 종료 시도 (선택적)
-            # pp.Quit() # 다른 작업 중일 수 있으므로 주의해서 사용
-            pass
+        src_file = str(pptx_path.resolve())
+        pdf_file = str(pdf_path.resolve())
+
+        def export(pp):
+            # WithWindow=False로 백그라운드 실행
+            pres = pp.Presentations.Open(src_file, WithWindow=False, ReadOnly=True)
+            try:
+                # 32 = ppSaveAsPDF
+                pres.SaveAs(pdf_file, 32)
+            finally:
+                pres.Close()
+
+        # COM 호출은 전용 스레드에서, PDF -> PNG 렌더링은 호출 스레드에서 수행
+        _powerpoint_worker().submit(export).result()
+        _render_deck_once(pdf_path, cache_dir, self._target_size)
 
     def _find_libreoffice(self) -> str | None:
-        common_paths = [
-            r"C:\Program Files\LibreOffice\program\soffice.exe",
-            r"C:\Program Files (x86)\LibreOffice\program\soffice.exe"
-        ]
-        for path in common_paths:
-            if Path(path).exists(): return path
-        return shutil.which("soffice")
+        return _discover_soffice_path()
+
+class _PowerPointWorker:
+    """PowerPoint COM 전용 스레드
+
+    COM 객체는 생성한 스레드(아파트먼트)에서만 써야 하므로
+    모든 호출을 한 스레드로 모으고, PowerPoint 인스턴스는 한 번만 띄워 재사용함
+    (사용자가 쓰는 중일 수 있어 종료하지 않음)
+    """
+
+    def __init__(self):
+        self._jobs: queue.Queue = queue.Queue()
+        self._app = None
+        threading.Thread(target=self._run, name="PowerPointCOM", daemon=True).start()
+
+    def submit(self, func) -> Future:
+        """func(PowerPoint.Application)을 COM 스레드에서 실행"""
+        future: Future = Future()
+        self._jobs.put((func, future))
+        return future
+
+    def _run(self):
+        try:
+            import pythoncom
+            pythoncom.CoInitialize()
+        except Exception as e:
+            print(f"[PowerPointWorker] COM 초기화 실패: {e}")
+        while True:
+            func, future = self._jobs.get()
+            try:
+                future.set_result(func(self._application()))
+            except BaseException as e:
+                # PowerPoint가 종료되었을 수 있으므로 다음 작업에서 다시 연결
+                self._app = None
+                future.set_exception(e)
+
+    def _application(self):
+        if self._app is None:
+            from win32com import client
+            self._app = client.Dispatch("PowerPoint.Application")
+        return self._app
+
+@functools.lru_cache(maxsize=1)
+def _powerpoint_worker() -> _PowerPointWorker:
+    return _PowerPointWorker()
+
+@functools.lru_cache(maxsize=1)
+def _powerpoint_available() -> bool:
+    """PowerPoint COM 사용 가능 여부
+
+    PowerPoint 기동 비용이 커서 프로세스당 한 번만 확인
+    """
+    try:
+        # 확인과 동시에 COM 스레드의 PowerPoint 인스턴스를 미리 띄워 둠
+        return _powerpoint_worker().submit(lambda pp: True).result()
+    except Exception:
+        return False
+
+@functools.lru_cache(maxsize=1)
+def _discover_soffice_path() -> str | None:
+    """Windows용 LibreOffice 실행 파일 경로 탐색 (프로세스당 한 번만 수행)"""
+    common_paths = [
+        r"C:\Program Files\LibreOffice\program\soffice.exe",
+        r"C:\Program Files (x86)\LibreOffice\program\soffice.exe"
+    ]
+    for path in common_paths:
+        if os.path.exists(path):
+            return path
+    return shutil.which("soffice")
 
 class LinuxSlideConverter(SlideConverter):
     """Linux용 변환기 (LibreOffice 기반)"""
     def __init__(self):
         self._cache_dir = Path(tempfile.gettempdir()) / "flow_linux_cache"
         self._cache_dir.mkdir(exist_ok=True)
+        _prune_stale_caches(self._cache_dir)
 
     def get_engine_name(self) -> str:
         return "LibreOffice (Linux)"
 
     def convert_slide(self, pptx_path: Path, index: int) -> QImage:
-        return _convert_with_libreoffice(pptx_path, index, self._cache_dir, "libreoffice")
-
-def _convert_with_libreoffice(pptx_path: Path, index: int, cache_dir: Path, soffice_cmd: str) -> QImage:
+        return _convert_with_libreoffice(
+            pptx_path, index, self._cache_dir, "libreoffice", self._target_size
+        )
+
+# 앱 전용 LibreOffice 사용자 프로필
+# (사용자가 띄워 둔 LibreOffice와 프로필을 공유하면 변환 없이 즉시 종료되는 문제 방지)
+_LO_PROFILE_URL = (Path(tempfile.gettempdir()) / "flow_lo_profile").as_uri()
+# 한 프로필은 동시에 하나의 soffice만 사용할 수 있으므로 변환을 직렬화
+_lo_lock = threading.Lock()
+
+def _convert_with_libreoffice(pptx_path: Path, index: int, cache_dir: Path,
+                              soffice_cmd: str,
+                              target_size: tuple[int, int] | None = None) -> QImage:
     """LibreOffice를 사용한 공통 변환 로직"""
     if not pptx_path:
-        return QImage(1280, 720, QImage.Format.Format_RGB32)
-    mtime = pptx_path.stat().st_mtime
-    pptx_hash = hashlib.md5(f"lo_v2_{str(pptx_path.resolve())}_{mtime}".encode()).hexdigest()
-    pptx_cache_dir = cache_dir / pptx_hash
-    
-    img_path = pptx_cache_dir / f"slide_{index}.png"
-    if img_path.exists():
-        return QImage(str(img_path))
-
+        return _FALLBACK_IMAGE
+    pptx_hash = _deck_key("lo_v2", pptx_path, target_size)
+    deck_dir = os.path.join(str(cache_dir), pptx_hash)
 
-    if not pptx_cache_dir.exists():
-        pptx_cache_dir.mkdir(parents=True, exist_ok=True)
-
-    pdf_path = pptx_cache_dir / "temp.pdf"
-    if not pdf_path.exists():
-        try:
-            cmd = [
-                soffice_cmd,
-                "--headless",
-                "--convert-to", "pdf",
-                "--outdir", str(pptx_cache_dir),
-                str(pptx_path)
-            ]
-            subprocess.run(cmd, check=True, capture_output=True)
-            # 생성된 파일명을 temp.pdf로 변경
-            for f in pptx_cache_dir.glob("*.pdf"):
-                f.replace(pdf_path)
-                break
-        except Exception as e:
-            print(f"[SlideConverter] LibreOffice 변환 실패: {e}")
+    _touch_deck(deck_dir)
+    img_path = os.path.join(deck_dir, f"slide_{index}.png")
+    image = _load_image(img_path)
+    if image is not None:
+        return image
 
-    if pdf_path.exists():
-        _convert_pdf_to_images(pdf_path, pptx_cache_dir)
+    def convert() -> None:
+        with _lo_lock:
+            # 락 대기 중 다른 덱 변환이 끝났을 수 있으므로 다시 확인
+            if _slide_exists(img_path):
+                return
 
-    if img_path.exists():
-        return QImage(str(img_path))
-    return QImage(1280, 720, QImage.Format.Format_RGB32)
+            _ensure_dir(deck_dir)
+            pptx_cache_dir = Path(deck_dir)
 
-def create_slide_converter() -> SlideConverter:
-    """플랫폼 및 아키텍처를 감지하여 최적의 변환기를 선택 (Windows는 PowerPoint 우선)"""
-    import sys
+            pdf_path = pptx_cache_dir / "temp.pdf"
+            if not pdf_path.exists():
+                try:
+                    cmd = [
+                        soffice_cmd,
+                        f"-env:UserInstallation={_LO_PROFILE_URL}",
+                        "--headless",
+                        "--nologo",
+                        "--norestore",
+                        "--nodefault",
+                        "--convert-to", "pdf",
+                        "--outdir", str(pptx_cache_dir),
+                        str(pptx_path)
+                    ]
+                    _run_converter(cmd)
+                    # LibreOffice는 "<원본 파일명>.pdf"로 저장하므로
+                    # 바로 temp.pdf로 변경
+                    lo_pdf = os.path.join(deck_dir, pptx_path.stem + ".pdf")
+                    os.replace(lo_pdf, str(pdf_path))
+                except Exception as e:
+                    print(f"[SlideConverter] LibreOffice 변환 실패: {e}")
+
+            if pdf_path.exists():
+                _render_deck_once(pdf_path, pptx_cache_dir, target_size)
+
+    # 같은 덱의 여러 슬라이드가 동시에 요청되어도 변환은 한 번만 수행
+    _single_flight(deck_dir, convert)
+
+    image = _load_image(img_path)
+    if image is not None:
+        return image
+    return _FALLBACK_IMAGE
+
+@functools.lru_cache(maxsize=None)
+def _find_docbuilder(os_key: str) -> tuple[Path, bool] | None:
+    """bin/ 아래에서 현재 OS/아키텍처에 맞는 ONLYOFFICE 실행 파일 탐색
+
+    폴더는 한 번만 훑고, 결과는 프로세스 동안 재사용함.
+
+    Returns:
+        (실행 파일 경로, OS 폴더만 일치한 Fallback 여부) 또는 None
+    """
     import platform
-    
-    # OS 맵핑
-    os_map = {"win32": "window", "darwin": "macos", "linux": "linux"}
-    os_key = os_map.get(sys.platform, sys.platform)
-    
-    # 1. Windows 라면 PowerPoint COM 엔진을 최우선으로 시도 (가장 정확한 폰트 렌더링)
+    import sys
+
+    search_base = _get_project_root() / "bin"
     if sys.platform == "win32":
-        win_converter = WindowsSlideConverter()
-        if win_converter._check_powerpoint_installed():
-            # print("[SlideConverter] PowerPoint 엔진 사용 (Windows 권장)")
-            return win_converter
+        target_names = ["docbuilder.exe"]
+    else:
+        target_names = ["docbuilder", "documentbuilder"]
 
-    # 2. 독립 엔진(ONLYOFFICE) 탐색
-    root = _get_project_root()
-    search_base = root / "bin"
-    target_names = ["docbuilder.exe"] if sys.platform == "win32" else ["docbuilder", "documentbuilder"]
-    
     machine = platform.machine().lower()
     arch_candidates = []
     if "64" in machine or "amd64" in machine:
@@ -284,24 +713,56 @@ def create_slide_converter() -> SlideConverter:
     if not arch_candidates:
         arch_candidates.append("x86")
 
+    # 한 번의 순회로 후보 수집: (파일명, 상위 폴더 소문자 경로, 경로)
+    candidates = []
+    for dir_path, _, file_names in os.walk(search_base):
+        parent = dir_path.lower()
+        if os_key not in parent:
+            continue
+        for name in file_names:
+            if name in target_names:
+                candidates.append((name, parent, Path(dir_path) / name))
+
     # 아키텍처 우선 탐색
     for arch in arch_candidates:
         for target in target_names:
-            for match in search_base.rglob(target):
-                path_str = str(match.parent).lower()
-                if os_key in path_str and arch in path_str:
-                    print(f"[SlideConverter] 독립 엔진 발견: {match.relative_to(search_base)}")
-                    return OnlyOfficeSlideConverter(match)
+            for name, parent, path in candidates:
+                if name == target and arch in parent:
+                    return path, False
 
     # OS 폴더 Fallback 탐색
     for target in target_names:
-        for match in search_base.rglob(target):
-            if os_key in str(match.parent).lower():
-                print(f"[SlideConverter] 독립 엔진 발견 (Fallback): {match.relative_to(search_base)}")
-                return OnlyOfficeSlideConverter(match)
+        for name, _, path in candidates:
+            if name == target:
+                return path, True
+    return None
+
+def create_slide_converter() -> SlideConverter:
+    """플랫폼 및 아키텍처를 감지하여 최적의 변환기를 선택 (Windows는 PowerPoint 우선)"""
+    import sys
+
+    # OS 맵핑
+    os_map = {"win32": "window", "darwin": "macos", "linux": "linux"}
+    os_key = os_map.get(sys.platform, sys.platform)
+
+    # 1. Windows 라면 PowerPoint COM 엔진을 최우선으로 시도 (가장 정확한 폰트 렌더링)
+    if sys.platform == "win32":
+        win_converter = WindowsSlideConverter()
+        if win_converter._check_powerpoint_installed():
+            # print("[SlideConverter] PowerPoint 엔진 사용 (Windows 권장)")
+            return win_converter
+
+    # 2. 독립 엔진(ONLYOFFICE) 탐색
+    found = _find_docbuilder(os_key)
+    if found is not None:
+        match, is_fallback = found
+        label = "독립 엔진 발견 (Fallback)" if is_fallback else "독립 엔진 발견"
+        rel = match.relative_to(_get_project_root() / "bin")
+        print(f"[SlideConverter] {label}: {rel}")
+        return OnlyOfficeSlideConverter(match)
 
     # 3. 최후의 보루: 리눅스 기본 변환기
     if sys.platform == "win32":
-        return WindowsSlideConverter() # 이미 위에서 체크했지만 구조상 유지
+        return win_converter
     return LinuxSlideConverter()
 
@@ -1,45 +1,120 @@
 """SlideManager - PPTX 슬라이드를 이미지로 관리하는 서비스"""
 
+import functools
+import glob
+import logging
+import os
+import threading
 import time
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from xml.etree import ElementTree
 from PySide6.QtCore import QObject, Signal
 from pptx import Presentation
 from pptx.exc import PackageNotFoundError
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 import sys
-from flow.services.slide_converter import SlideConverter, create_slide_converter
+from flow.services.slide_converter import (
+    SlideConverter,
+    content_signature,
+    create_slide_converter,
+    invalidate_deck_cache,
+    is_fallback_image,
+)
+
+logger = logging.getLogger(__name__)
+
+# 진행률 시그널 최소 간격 (초당 약 30회, 마지막 진행률은 항상 전달)
+_PROGRESS_INTERVAL_NS = 33_000_000
 
 class SlideLoadError(Exception):
     """PPTX 로드 실패 예외"""
     pass
 
-class SlideUpdateHandler(FileSystemEventHandler):
+def _count_slides(path: Path) -> int | None:
+    """presentation.xml만 읽어 슬라이드 개수 계산 (실패 시 None)
+    
+    최상위 p:sldIdLst의 항목만 셈 (구역을 쓰는 덱의 extLst 안 p14:sldId는 제외)
+    """
+    try:
+        with zipfile.ZipFile(path) as z:
+            root = ElementTree.fromstring(z.read("ppt/presentation.xml"))
+    except (zipfile.BadZipFile, KeyError, OSError, ElementTree.ParseError):
+        return None
+    for child in root:
+        if child.tag.rpartition("}")[2] == "sldIdLst":
+            return len(child)
+    return 0
+
+@functools.lru_cache(maxsize=128)
+def _resolve_pptx_path(path_str: str) -> Path:
+    """PPTX 경로를 절대 경로로 변환 (같은 경로 반복 요청 시 resolve 재호출 방지)"""
+    return Path(path_str).resolve()
+
+class SlideUpdateHandler(PatternMatchingEventHandler):
     """파일 변경 이벤트 핸들러"""
     def __init__(self, target_path, callback):
-        self.target_path = Path(target_path).resolve()
+        target = Path(target_path).resolve()
+        # 같은 폴더의 다른 파일/폴더 이벤트는 watchdog 디스패치 단계에서 걸러냄
+        super().__init__(
+            patterns=[f"*{glob.escape(target.name)}"],
+            ignore_directories=True,
+            case_sensitive=False,
+        )
+        self.target_path = target
+        self._target_str = str(self.target_path)
+        self._target_name = self.target_path.name
         self.callback = callback
-        self.last_triggered = 0
+        self.last_triggered_ns = 0
+        # 마지막으로 알린 시점의 파일 내용 서명 (자동 저장 등 내용 없는 수정 무시)
+        self._last_signature = content_signature(self.target_path)
         
     def on_modified(self, event):
-        if event.is_directory:
-            return
-        
+        self._handle(event.src_path)
+    
+    def on_created(self, event):
+        # 삭제 후 새로 쓰는 방식으로 저장하는 프로그램 대응
+        self._handle(event.src_path)
+    
+    def on_moved(self, event):
+        # 임시 파일에 저장한 뒤 원본 이름으로 바꾸는 방식(PowerPoint 등) 대응
+        self._handle(event.dest_path)
+    
+    def _is_target(self, path: str) -> bool:
+        """감시 대상 파일인지 확인"""
+        # 파일명이 다르면 경로 계산 없이 바로 제외
+        if not path.endswith(self._target_name):
+            return False
+        # 대부분 문자열 비교로 끝나고, 심볼릭 링크 등으로 다를 때만 resolve() 호출
+        if os.path.abspath(path) == self._target_str:
+            return True
+        return str(Path(path).resolve()) == self._target_str
+    
+    def _handle(self, path: str) -> None:
         # 특정 파일만 감시
-        if Path(event.src_path).resolve() != self.target_path:
+        if not self._is_target(path):
             return
             
         # 짧은 시간에 여러 번 발생하는 이벤트 방지 (Debounce)
-        now = time.time()
-        if now - self.last_triggered > 0.1:
+        now_ns = time.monotonic_ns()
+        if now_ns - self.last_triggered_ns > 100_000_000:
+            signature = content_signature(self.target_path)
+            if signature is not None and signature == self._last_signature:
+                return
+            self._last_signature = signature
+            # 파일이 바뀌었으므로 경로/캐시 존재 여부 메모를 버림
+            invalidate_deck_cache()
             self.callback()
-            self.last_triggered = now
+            self.last_triggered_ns = now_ns
 
-from PySide6.QtCore import QObject, Signal, QThread
+from PySide6.QtCore import QObject, Signal, QThread, QRunnable, QThreadPool
 
 class PPTLoadWorker(QThread):
     """PPT 로딩을 백그라운드에서 수행하는 워커"""
-    finished = Signal(int)          # 슬라이드 개수
+    loaded = Signal(int)            # 슬라이드 개수 (QThread.finished와 구분)
     error = Signal(str)             # 에러 메시지
     progress = Signal(int, int, str)  # 진행률 (current, total, engine_name)
     
@@ -51,77 +126,150 @@ class PPTLoadWorker(QThread):
     def run(self):
         try:
             count = self.manager._do_load_pptx(self.path, progress_callback=self._emit_progress)
-            self.finished.emit(count)
+            self.loaded.emit(count)
         except Exception as e:
             self.error.emit(str(e))
     
     def _emit_progress(self, current: int, total: int, engine_name: str):
         self.progress.emit(current, total, engine_name)
 
+class SlideRenderTask(QRunnable):
+    """슬라이드 한 장을 스레드 풀에서 렌더링하고 완료를 SlideManager에 알리는 작업"""
+    
+    def __init__(self, manager: 'SlideManager', path: Path | None, index: int):
+        super().__init__()
+        self.manager = manager
+        self.path = path
+        self.index = index
+        
+    def run(self):
+        try:
+            image = self.manager._render_slide(self.path, self.index)
+        except Exception as e:
+            print(f"[SlideRenderTask] 슬라이드 {self.index} 렌더링 실패: {e}")
+            image = None
+        self.manager._on_slide_rendered(self.path, self.index, image)
+
 class SlideManager(QObject):
     """PPTX 파일을 로드하고 슬라이드 이미지를 관리함"""
     
+    IMAGE_CACHE_SIZE = 32           # 메모리에 보관할 최근 슬라이드 이미지 수
+    PREFETCH_OFFSETS = (1, 2, -1)   # 슬라이드 요청 시 미리 읽어 둘 주변 슬라이드 (상대 위치)
+    
     file_changed = Signal()         # 파일 변경 시 발생
     load_started = Signal()         # 로딩 시작
     load_finished = Signal(int)     # 로딩 완료 (슬라이드 수)
     load_error = Signal(str)        # 로딩 에러
     load_progress = Signal(int, int, str)  # 진행률 (current, total, engine_name)
+    slide_ready = Signal(int, object)      # 비동기 렌더링 완료 (index, QImage)
     
     def __init__(self, converter: SlideConverter = None) -> None:
         super().__init__()
         self._pptx_path: Path | None = None
         self._slide_count: int = 0
         self._converter = converter or create_slide_converter()
+        # 마지막으로 설정한 표시 영역 크기
+        self._target_size: tuple[int, int] | None = None
         self._observer = None
         self._load_worker = None
+        self._pending_load: str | Path | None = None  # 로딩 중 들어온 다른 파일 요청 (마지막 것만 유지)
+        # 최근 슬라이드 이미지 LRU: (PPTX 경로, 인덱스) -> QImage
+        self._image_cache: OrderedDict[tuple[Path | None, int], object] = OrderedDict()
+        self._image_cache_lock = threading.Lock()
+        self.file_changed.connect(self._clear_image_cache)
+        self.file_changed.connect(_resolve_pptx_path.cache_clear)  # 교체/이름 변경 시 경로 다시 확인
+        # 비동기 슬라이드 렌더링용 스레드 풀 (UI 스레드 블로킹 방지)
+        self._render_pool = QThreadPool(self)
+        self._render_pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) // 2))
+        # 진행 중인 백그라운드 렌더링: (PPTX 경로, 인덱스) -> 완료 시 slide_ready 발생 여부
+        # (미리 읽기는 False로 시작하고, 그 사이 비동기 요청이 오면 True로 바뀜)
+        self._pending_renders: dict[tuple[Path | None, int], bool] = {}
         
     def load_pptx(self, path: str | Path):
         """비동기 방식으로 PPTX 로드 시작"""
         if not path or not str(path).strip():
             # 빈 경로는 즉시 동기적으로 처리 (초기화)
+            self._pending_load = None
             self._pptx_path = None
             self._slide_count = 0
             self.load_finished.emit(0)
             return
 
         if self._load_worker and self._load_worker.isRunning():
-            return # 이미 로딩 중이면 무시
+            # 같은 파일은 이미 로딩 중이므로 무시, 다른 파일은 현재 로딩이 끝난 뒤 이어서 로드
+            if _resolve_pptx_path(str(path)) == _resolve_pptx_path(str(self._load_worker.path)):
+                self._pending_load = None
+            else:
+                self._pending_load = path
+            return
             
         self.load_started.emit()
         self._load_worker = PPTLoadWorker(self, path)
-        self._load_worker.finished.connect(self.load_finished.emit)
+        self._load_worker.loaded.connect(self.load_finished.emit)
         self._load_worker.error.connect(self.load_error.emit)
         self._load_worker.progress.connect(self.load_progress.emit)  # 진행률 연결
+        # 대기 중인 요청은 스레드가 완전히 끝난 뒤(QThread.finished)에 시작
+        # (UI 스레드에서 기다리지 않음)
+        self._load_worker.finished.connect(self._start_pending_load)
         self._load_worker.start()
 
+    def _start_pending_load(self):
+        """로딩 중 대기시킨 다른 파일 요청이 있으면 이어서 로드"""
+        path, self._pending_load = self._pending_load, None
+        if path:
+            self.load_pptx(path)
+
     def _do_load_pptx(self, path: str | Path, progress_callback=None) -> int:
         """실제 로딩 로직 (백그라운드 스레드에서 호출됨)"""
         import time
         start_time = time.time()
-        p = Path(path).resolve() if path and str(path).strip() else None
+        p = _resolve_pptx_path(str(path)) if path and str(path).strip() else None
         
         # 최적화: 이미 같은 파일이 로드되어 있다면 즉시 반환
         if p == self._pptx_path and self._slide_count > 0:
             return self._slide_count
             
+        if p != self._pptx_path:
+            self._clear_image_cache()
         self._pptx_path = p
         
         if p and p.is_file():
             engine_info = self._converter.get_engine_name()
             print(f"[SlideManager] PPT 로드 시작: {p.name} (엔진: {engine_info})")
             try:
-                prs = Presentation(str(p))
-                self._slide_count = len(prs.slides)
+                # 전체 문서 모델을 만들지 않고 슬라이드 목록만 확인
+                count = _count_slides(p)
+                if count is None:
+                    count = len(Presentation(str(p)).slides)
+                self._slide_count = count
 
                 # 모든 슬라이드 이미지를 미리 변환 (백그라운드 스레드)
                 if self._slide_count > 0:
-                    for i in range(self._slide_count):
-                        self.get_slide_image(i)
-                        # 진행률 콜백 호출
-                        if progress_callback:
-                            progress_callback(i + 1, self._slide_count, engine_info)
-                        if (i + 1) % 5 == 0 or i + 1 == self._slide_count:
-                             print(f"[SlideManager] 이미지 생성 중... ({i + 1}/{self._slide_count})")
+                    total = self._slide_count
+                    last_emit_ns = 0
+                    
+                    def report(done: int) -> None:
+                        # 진행률 콜백 호출 (빠른 엔진에서 시그널이 몰리지 않도록 간격 제한)
+                        nonlocal last_emit_ns
+                        now = time.monotonic_ns()
+                        if progress_callback and (done == total or now - last_emit_ns >= _PROGRESS_INTERVAL_NS):
+                            last_emit_ns = now
+                            progress_callback(done, total, engine_info)
+                        # 장별 진행 로그는 디버그 레벨에서만 (워커의 stdout 쓰기 최소화)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("[SlideManager] 이미지 생성 중... (%d/%d)", done, total)
+                    
+                    # 첫 슬라이드에서 덱 전체 변환이 일어나므로 먼저 단독으로 처리하고,
+                    # 나머지(캐시된 PNG 로드)는 스레드 풀에서 동시에 진행
+                    self._render_slide(p, 0)
+                    report(1)
+                    if total > 1:
+                        workers = min(8, os.cpu_count() or 1, total - 1)
+                        with ThreadPoolExecutor(max_workers=workers) as pool:
+                            futures = [pool.submit(self._render_slide, p, i) for i in range(1, total)]
+                            for done, future in enumerate(as_completed(futures), start=2):
+                                future.result()
+                                report(done)
                 
                 elapsed = time.time() - start_time
                 print(f"[SlideManager] PPT 로드 완료: {self._slide_count} 슬라이드 전체 변환됨 (총 소요 시간: {elapsed:.2f}초)")
@@ -137,27 +285,118 @@ class SlideManager(QObject):
             
         return self._slide_count
     
+    def set_target_size(self, width: int, height: int) -> None:
+        """슬라이드를 표시할 최대 화면 크기 설정 (렌더링 해상도 결정에 사용)
+
+        크기가 바뀌면 이전 해상도로 만든 메모리 이미지를 버려 새 크기로 다시 렌더링함
+        """
+        size = (width, height)
+        if size == self._target_size:
+            return
+        changed = self._target_size is not None
+        self._target_size = size
+        if self._converter:
+            self._converter.set_target_size(width, height)
+        if changed:
+            self._clear_image_cache()
+    
     def get_slide_count(self) -> int:
         """현재 로드된 슬라이드 개수 반환"""
         return self._slide_count
     
     def get_slide_image(self, index: int):
-        """특정 슬라이드의 이미지를 반환"""
-        if self._converter:
-            return self._converter.convert_slide(self._pptx_path, index)
-        raise RuntimeError("이미지 변환기가 설정되지 않았습니다.")
+        """특정 슬라이드의 이미지를 반환 (최근 이미지는 메모리에서 바로 반환)"""
+        image = self._render_slide(self._pptx_path, index)
+        self._prefetch_neighbours(index)
+        return image
+    
+    def _prefetch_neighbours(self, index: int) -> None:
+        """다음/이전 슬라이드를 백그라운드에서 미리 LRU에 올려 둠 (넘길 때 대기 없음)"""
+        path = self._pptx_path
+        if path is None:
+            return
+        for offset in self.PREFETCH_OFFSETS:
+            neighbour = index + offset
+            if not 0 <= neighbour < self._slide_count:
+                continue
+            key = (path, neighbour)
+            with self._image_cache_lock:
+                if key in self._image_cache or key in self._pending_renders:
+                    continue
+                self._pending_renders[key] = False
+            self._render_pool.start(SlideRenderTask(self, path, neighbour))
+    
+    def get_slide_image_async(self, index: int):
+        """메모리에 있으면 바로 반환하고, 없으면 백그라운드 렌더링 후 slide_ready로 전달
+        
+        Returns:
+            캐시된 QImage 또는 None (렌더링 예약됨)
+        """
+        path = self._pptx_path
+        image = self._cached_image((path, index))
+        if image is not None:
+            return image
+        
+        with self._image_cache_lock:
+            already_pending = (path, index) in self._pending_renders
+            self._pending_renders[(path, index)] = True
+        if not already_pending:
+            self._render_pool.start(SlideRenderTask(self, path, index))
+        return None
+    
+    def _cached_image(self, key: tuple[Path | None, int]):
+        """LRU에서 이미지 조회 (없으면 None)"""
+        with self._image_cache_lock:
+            image = self._image_cache.get(key)
+            if image is not None:
+                self._image_cache.move_to_end(key)
+            return image
+    
+    def _render_slide(self, path: Path | None, index: int):
+        """지정한 PPTX의 슬라이드 이미지 반환 (LRU 확인 후 변환기 호출)"""
+        if not self._converter:
+            raise RuntimeError("이미지 변환기가 설정되지 않았습니다.")
+        
+        key = (path, index)
+        image = self._cached_image(key)
+        if image is not None:
+            return image
+        
+        image = self._converter.convert_slide(path, index)
+        if image is None or is_fallback_image(image):
+            return image  # 실패한 변환은 캐시하지 않아 다음 요청 때 다시 시도
+        with self._image_cache_lock:
+            self._image_cache[key] = image
+            while len(self._image_cache) > self.IMAGE_CACHE_SIZE:
+                self._image_cache.popitem(last=False)
+        return image
+    
+    def _on_slide_rendered(self, path: Path | None, index: int, image) -> None:
+        """비동기 렌더링 완료 처리 (그 사이 다른 PPT로 바뀌었으면 알리지 않음)"""
+        with self._image_cache_lock:
+            notify = self._pending_renders.pop((path, index), False)
+        if notify and image is not None and path == self._pptx_path:
+            self.slide_ready.emit(index, image)
+    
+    def _clear_image_cache(self) -> None:
+        """메모리 이미지 캐시 비우기 (파일 변경/다른 PPT 로드 시)"""
+        with self._image_cache_lock:
+            self._image_cache.clear()
 
     def start_watching(self, path: str | Path = None):
         """파일 변경 감시 시작"""
         if path:
             self._pptx_path = Path(path)
         
-        if not self._pptx_path or not self._pptx_path.parent.exists():
+        if not self._pptx_path:
+            return
+        resolved = _resolve_pptx_path(str(self._pptx_path))
+        if not os.path.isdir(resolved.parent):
             return
 
         self.stop_watching()
         
-        self._pptx_path = self._pptx_path.resolve()
+        self._pptx_path = resolved
         self._observer = Observer()
         handler = SlideUpdateHandler(self._pptx_path, self.file_changed.emit)
         self._observer.schedule(handler, str(self._pptx_path.parent), recursive=False)
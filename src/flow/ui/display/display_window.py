@@ -3,10 +3,13 @@
 두 번째 모니터에 전체화면으로 표시되는 슬라이드 전용 창
 """
 
+from collections import OrderedDict
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QApplication
 from PySide6.QtGui import QFont, QColor, QPalette, QScreen, QPixmap
-from PySide6 import QtGui
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
+
+from flow.ui.image_utils import smart_scale
 
 
 class DisplayWindow(QWidget):
@@ -25,10 +28,16 @@ class DisplayWindow(QWidget):
     BG_BLACK = "black"
     BG_CHROMA_GREEN = "chroma"
     
+    PIXMAP_CACHE_SIZE = 8   # 최근 표시한 슬라이드의 화면 크기 픽스맵 보관 수
+    
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._current_lyric = ""
         self._background_mode = self.BG_BLACK
+        # 폰트 조회는 결과가 변하지 않으므로 한 번만 확인 (Pretendard 우선 적용)
+        self._font_family = "Pretendard" if QFont("Pretendard").exactMatch() else "Malgun Gothic"
+        self._font_size: int | None = None  # 마지막으로 적용한 폰트 크기
+        self._resize_pending = False        # 연속 리사이즈를 한 번의 재조정으로 묶기 위한 플래그
         
         self._setup_ui()
         self._apply_style()
@@ -45,39 +54,34 @@ class DisplayWindow(QWidget):
         self._main_layout.setContentsMargins(0, 0, 0, 0) # 기본 마진 제거
         
         self._lyric_label = QLabel()
+        # 글자색만 정적 스타일시트로 한 번 지정 (배경색은 팔레트로 변경)
+        self._lyric_label.setStyleSheet("color: white; background-color: transparent;")
         self._lyric_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._lyric_label.setWordWrap(True)
         self._main_layout.addWidget(self._lyric_label)
         
         # 슬라이드 보관용 (리사이즈 시 필요)
         self._current_image = None
+        self._empty_pixmap = QPixmap()
+        # 변환/스케일 결과 LRU: (QImage.cacheKey, 물리 너비, 물리 높이, 배율) -> QPixmap
+        # 슬라이드를 앞뒤로 넘길 때 QImage -> QPixmap 변환과 스케일을 반복하지 않음
+        self._pixmap_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+        self._scaled_key = None     # 현재 라벨에 표시 중인 픽스맵의 키
         
         # 기본 폰트 설정
         self.set_font_size(72)
     
     def _apply_style(self) -> None:
-        """스타일 적용"""
+        """스타일 적용 (배경색은 팔레트로 바꿔 스타일시트 재해석을 피함)"""
         if self._background_mode == self.BG_BLACK:
             bg_color = "#000000"
         else:  # BG_CHROMA_GREEN
             bg_color = "#00FF00"
         
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {bg_color};
-            }}
-            QLabel {{
-                color: white;
-                background-color: transparent;
-            }}
-        """)
-        
-        # 크로마키 모드에서는 텍스트 그림자 효과
-        if self._background_mode == self.BG_CHROMA_GREEN:
-            self._lyric_label.setStyleSheet("""
-                color: white;
-                background-color: transparent;
-            """)
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor(bg_color))
+        self.setAutoFillBackground(True)
+        self.setPalette(palette)
     
     def set_background_mode(self, mode: str) -> None:
         """배경색 모드 설정"""
@@ -93,20 +97,20 @@ class DisplayWindow(QWidget):
         # 기준 높이를 1080px로 잡고 비율 계산
         screen_height = self.height() or 1080
         scaled_size = max(1, int(base_size * (screen_height / 1080)))
+        if scaled_size == self._font_size:
+            return
         
-        font = QFont("Pretendard", scaled_size) # Pretendard 우선 적용
-        if not font.exactMatch():
-            font = QFont("Malgun Gothic", scaled_size)
-        
+        font = QFont(self._font_family, scaled_size)
         font.setBold(True)
         self._lyric_label.setFont(font)
+        self._font_size = scaled_size
     
     def show_lyric(self, text: str) -> None:
         """텍스트 표시"""
-        from PySide6.QtGui import QPixmap
         self._current_lyric = text
         self._lyric_label.setText(text)
-        self._lyric_label.setPixmap(QPixmap())  # 텍스트 표시 시 이미지는 지움
+        self._lyric_label.setPixmap(self._empty_pixmap)  # 텍스트 표시 시 이미지는 지움
+        self._scaled_key = None
     
     def show_image(self, image) -> None:
         """슬라이드 이미지 표시"""
@@ -115,34 +119,51 @@ class DisplayWindow(QWidget):
         self._main_layout.setContentsMargins(0, 0, 0, 0) # 이미지 시 마진 없음
         
         if image:
-            from PySide6.QtGui import QPixmap
-            # QImage -> QPixmap 변환
-            pixmap = QPixmap.fromImage(image)
-            
-            # [화질 개선] High-DPI 디스플레이 대응
-            ratio = self.devicePixelRatioF()
-            # 윈도우의 실제 픽셀 크기에 맞춰 스케일링
-            target_size = self.size() * ratio
-            
-            scaled_pixmap = pixmap.scaled(
-                target_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            # 배율 정보 주입하여 QLabel이 올바른 크기로 그리게 함
-            scaled_pixmap.setDevicePixelRatio(ratio)
-            
-            self._lyric_label.setPixmap(scaled_pixmap)
+            self._rescale_current()
             # setScaledContents(True)는 화질을 떨어뜨릴 수 있으므로 False로 유지 (이미 수동 스케일링함)
             self._lyric_label.setScaledContents(False)
         else:
-            self._lyric_label.setPixmap(QtGui.QPixmap())
+            self._lyric_label.setPixmap(self._empty_pixmap)
+            self._scaled_key = None
+
+    def _rescale_current(self) -> None:
+        """현재 슬라이드를 창 크기에 맞춰 표시 (이미지·크기·배율이 같으면 생략)"""
+        image = self._current_image
+        # [화질 개선] High-DPI 디스플레이 대응
+        ratio = self.devicePixelRatioF()
+        # 윈도우의 실제 픽셀 크기에 맞춰 스케일링
+        target_size = self.size() * ratio
+        key = (image.cacheKey(), target_size.width(), target_size.height(), ratio)
+        if key == self._scaled_key:
+            return
+        
+        scaled_pixmap = self._pixmap_cache.get(key)
+        if scaled_pixmap is not None:
+            self._pixmap_cache.move_to_end(key)
+        else:
+            scaled_pixmap = smart_scale(QPixmap.fromImage(image), target_size)
+            # 배율 정보 주입하여 QLabel이 올바른 크기로 그리게 함
+            scaled_pixmap.setDevicePixelRatio(ratio)
+            self._pixmap_cache[key] = scaled_pixmap
+            while len(self._pixmap_cache) > self.PIXMAP_CACHE_SIZE:
+                self._pixmap_cache.popitem(last=False)
+        
+        self._lyric_label.setPixmap(scaled_pixmap)
+        self._scaled_key = key
 
     def resizeEvent(self, event) -> None:
         """창 크기가 바뀔 때 내용물 재조정 (모니터 크기 대응)"""
         super().resizeEvent(event)
+        # 전체화면 전환 등으로 연달아 들어오는 리사이즈는 다음 프레임에 한 번만 처리
+        if not self._resize_pending:
+            self._resize_pending = True
+            QTimer.singleShot(16, self._apply_resize)
+    
+    def _apply_resize(self) -> None:
+        """보류된 리사이즈 반영"""
+        self._resize_pending = False
         if self._current_image:
-            self.show_image(self._current_image)
+            self._rescale_current()
         elif self._current_lyric:
             self._apply_scaled_font(72) # 기본 크기 72pt 기준 재계산
     
@@ -150,7 +171,8 @@ class DisplayWindow(QWidget):
         """텍스트 및 이미지 지우기"""
         self._current_lyric = ""
         self._lyric_label.clear()
-        self._lyric_label.setPixmap(QPixmap())
+        self._lyric_label.setPixmap(self._empty_pixmap)
+        self._scaled_key = None
     
     def show_fullscreen_on_secondary(self) -> None:
         """두 번째 모니터에 전체화면으로 표시"""
@@ -4,11 +4,12 @@
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QScrollArea, QMenu
-from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QMouseEvent, QAction, QFont
-from PySide6.QtCore import Signal, Qt, QPoint, QRect, QSize
+from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QPen, QMouseEvent, QAction, QFont
+from PySide6.QtCore import Signal, Qt, QPoint, QPointF, QRect, QSize
 
 from flow.domain.score_sheet import ScoreSheet
 from flow.domain.hotspot import Hotspot
+from flow.ui.image_utils import smart_scale
 
 
 class ScoreCanvas(QWidget):
@@ -32,6 +33,12 @@ class ScoreCanvas(QWidget):
     HOTSPOT_RADIUS = 15
     HOTSPOT_COLOR = QColor(255, 160, 0, 150)       # 비선택: 선명한 주황 (가시성 + 투명도 밸런스)
     HOTSPOT_SELECTED_COLOR = QColor(33, 150, 243, 180) # 선택: 브랜드 블루 (투명도 조절)
+    # 핫스팟 외곽선/글자 펜 (그릴 때마다 새로 만들지 않도록 공유)
+    HOTSPOT_PEN = QPen(Qt.GlobalColor.white, 1)
+    HOTSPOT_SELECTED_PEN = QPen(Qt.GlobalColor.white, 2)
+    HOTSPOT_LOCKED_PEN = QPen(QColor(200, 200, 200, 180), 1, Qt.PenStyle.DashLine)
+    HOTSPOT_TEXT_PEN = QPen(Qt.GlobalColor.white)
+    HOTSPOT_PAINT_MARGIN = 3    # 외곽선 두께 + 안티앨리어싱 여유 (갱신 영역 계산용)
     
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -39,7 +46,7 @@ class ScoreCanvas(QWidget):
         self._pixmap: QPixmap | None = None
         self._selected_hotspot_id: str | None = None
         self._edit_mode = True
-        self._scaled_pixmap: QPixmap | None = None # 캐시된 스케일 이미지
+        self._frame_pixmap: QPixmap | None = None # 캐시된 배경 + 스케일 악보 이미지
         self._last_size = QSize(0, 0)
         self._scale_x = 1.0
         self._scale_y = 1.0
@@ -98,7 +105,8 @@ class ScoreCanvas(QWidget):
         else:
             self._pixmap = None
         
-        self._scaled_pixmap = None # 악보 변경 시 캐시 초기화
+        self._frame_pixmap = None # 악보 변경 시 캐시 초기화
+        self._update_geometry()
         self.update()
     
     def set_edit_mode(self, enabled: bool) -> None:
@@ -122,50 +130,51 @@ class ScoreCanvas(QWidget):
         return self._score_sheet.find_hotspot_by_id(self._selected_hotspot_id)
     
     def paintEvent(self, event) -> None:
-        """그리기"""
+        """그리기 (배경·악보는 캐시된 픽스맵을 그대로 복사하고 핫스팟만 새로 그림)"""
+        # [화질 개선] High-DPI(고배율) 디스플레이 대응
+        # logical size가 아닌 physical size(실제 픽셀)로 그려 선명도 유지
+        target_size = self.size() * self.devicePixelRatioF()
+        if target_size.isEmpty():
+            return
+        if self._frame_pixmap is None or target_size != self._last_size:
+            self._frame_pixmap = self._build_frame(target_size)
+        
         painter = QPainter(self)
         # Antialiasing과 SmoothPixmapTransform 모두 활성화하여 최상의 화질 보장
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmap(0, 0, self._frame_pixmap)
         
+        # 핫스팟 그리기 (드래그/매핑 변경이 바로 보이도록 매번 그림, 갱신 영역 밖은 생략)
+        self._draw_hotspots(painter, event.rect())
+    
+    def _build_frame(self, target_size: QSize) -> QPixmap:
+        """배경과 악보 이미지(또는 안내 문구)를 한 장의 픽스맵으로 미리 그림"""
+        ratio = self.devicePixelRatioF()
+        frame = QPixmap(target_size)
+        # Qt가 내부적으로 배율을 인식하게 설정 (logical 좌표로 그리면 됨)
+        frame.setDevicePixelRatio(ratio)
         # 배경
-        painter.fillRect(self.rect(), QColor(26, 26, 26))
+        frame.fill(QColor(26, 26, 26))
+        self._last_size = target_size
+        
+        painter = QPainter(frame)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         
         if not self._score_sheet:
             self._draw_placeholder(painter, "곡을 선택하세요")
-            return
-        
-        if self._pixmap:
-            # [화질 개선] High-DPI(고배율) 디스플레이 대응
-            # logical size가 아닌 physical size(실제 픽셀)로 스케일링하여 선명도 유지
-            ratio = self.devicePixelRatioF()
-            target_size = self.size() * ratio
-            
-            if self._scaled_pixmap is None or target_size != self._last_size:
-                self._scaled_pixmap = self._pixmap.scaled(
-                    target_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                # Qt가 내부적으로 배율을 인식하게 설정
-                self._scaled_pixmap.setDevicePixelRatio(ratio)
-                self._last_size = target_size
-                
-                # 좌표 변환을 위한 캐시 업데이트
-                sw = self._scaled_pixmap.width() / ratio
-                sh = self._scaled_pixmap.height() / ratio
-                self._scale_x = sw / self._pixmap.width()
-                self._scale_y = sh / self._pixmap.height()
-                self._offset_x = (self.width() - sw) // 2
-                self._offset_y = (self.height() - sh) // 2
-            
-            # 중앙 배치 계산 (SetDevicePixelRatio 덕분에 logical 좌표로 그리면 됨)
-            painter.drawPixmap(int(self._offset_x), int(self._offset_y), self._scaled_pixmap)
+        elif self._pixmap:
+            scaled_pixmap = smart_scale(self._pixmap, target_size)
+            scaled_pixmap.setDevicePixelRatio(ratio)
+            self._update_geometry()  # 배율(모니터) 변경은 resizeEvent 없이 올 수 있음
+            # 중앙 배치
+            painter.drawPixmap(int(self._offset_x), int(self._offset_y), scaled_pixmap)
         else:
             self._draw_placeholder(painter, f"악보: {self._score_sheet.name}\n(이미지를 추가하세요)")
         
-        # 핫스팟 그리기
-        self._draw_hotspots(painter)
+        painter.end()
+        return frame
     
     def _draw_placeholder(self, painter: QPainter, text: str) -> None:
         """플레이스홀더 텍스트 그리기"""
@@ -173,8 +182,8 @@ class ScoreCanvas(QWidget):
         painter.setFont(self._font_placeholder)
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, text)
     
-    def _draw_hotspots(self, painter: QPainter) -> None:
-        """핫스팟들 그리기"""
+    def _draw_hotspots(self, painter: QPainter, clip_rect: QRect | None = None) -> None:
+        """핫스팟들 그리기 (clip_rect가 있으면 겹치지 않는 핫스팟은 건너뜀)"""
         if not self._score_sheet:
             return
         
@@ -196,8 +205,12 @@ class ScoreCanvas(QWidget):
                 chorus_labels[h.id] = label_char
                 chorus_counter += 1
                 
-        # 2. 핫스팟 그리기 루프
+        # 2. 원은 스타일별 경로에 모아 한 번에 그리고, 글자는 마지막에 한꺼번에 그림
         v_idx = self._verse_index
+        r = self.HOTSPOT_RADIUS
+        margin = r + self.HOTSPOT_PAINT_MARGIN
+        circles = {}   # 스타일("normal"/"locked"/"selected") -> QPainterPath
+        labels = []    # (글자 영역, 폰트, 레이블)
         for i, hotspot in enumerate(ordered_hotspots):
             # 레이어 기반 편집 상태 판별
             is_selected = (hotspot.id == self._selected_hotspot_id)
@@ -213,26 +226,7 @@ class ScoreCanvas(QWidget):
                 int(hotspot.y * self._scale_y + self._offset_y)
             )
             
-            # 모든 버튼을 보이게 하되, 타 레이어 버튼은 외곽선 스타일로 '편집 잠금' 표시
-            if is_selected:
-                color = self.HOTSPOT_SELECTED_COLOR
-                pen = QPen(Qt.GlobalColor.white, 2)
-            else:
-                color = self.HOTSPOT_COLOR
-                if is_editable:
-                    pen = QPen(Qt.GlobalColor.white, 1)
-                else:
-                    # 타 레이어 전용 버튼 (Verse 모드에서만 보임): 연한 점선 외곽선
-                    pen = QPen(QColor(200, 200, 200, 180), 1, Qt.PenStyle.DashLine)
-            
-            # 원 그리기
-            painter.setBrush(color)
-            painter.setPen(pen)
-            painter.drawEllipse(pos, self.HOTSPOT_RADIUS, self.HOTSPOT_RADIUS)
-            
-            # 텍스트 드로잉 (잘림 방지를 위해 범위 확대 및 폰트 설정)
-            painter.setPen(Qt.GlobalColor.white)
-            
+            # 레이블 번호는 건너뛴 핫스팟도 세어야 하므로 먼저 결정
             # [수정] 레이블 결정 로직: 
             # - 후렴 버튼으로 식별된 경우: 미리 계산된 알파벳(A, B, C...) 유지
             # - 그 외(절 전용 버튼): 별도의 카운터를 사용하여 숫자(1, 2, 3...) 부여 (건너뛰기 방지)
@@ -241,7 +235,28 @@ class ScoreCanvas(QWidget):
             else:
                 verse_display_counter += 1
                 display_name = str(verse_display_counter)
-                
+            
+            # 갱신 영역과 겹치지 않으면 그리지 않음 (부분 갱신 시 픽셀 작업 절약)
+            if clip_rect is not None and not clip_rect.intersects(
+                QRect(pos.x() - margin, pos.y() - margin, margin * 2, margin * 2)
+            ):
+                continue
+            
+            # 모든 버튼을 보이게 하되, 타 레이어 버튼은 외곽선 스타일로 '편집 잠금' 표시
+            if is_selected:
+                style = "selected"
+            elif is_editable:
+                style = "normal"
+            else:
+                # 타 레이어 전용 버튼 (Verse 모드에서만 보임): 연한 점선 외곽선
+                style = "locked"
+            
+            path = circles.get(style)
+            if path is None:
+                path = circles[style] = QPainterPath()
+                path.setFillRule(Qt.FillRule.WindingFill)  # 겹친 원도 빈 곳 없이 채움
+            path.addEllipse(QPointF(pos), r, r)
+            
             label = display_name
             # [수정] 현재 절 매핑 우선, 없으면 후렴 매핑 표시 (내비게이션 지원)
             slide_idx = hotspot.get_slide_index(self._verse_index)
@@ -253,19 +268,55 @@ class ScoreCanvas(QWidget):
                 
             if slide_idx >= 0:
                 label = f"{display_name}-{slide_idx + 1}"
-                painter.setFont(self._font_small)
+                font = self._font_small
             else:
-                painter.setFont(self._font_main)
+                font = self._font_main
                 
             # 원 안의 중앙에 텍스트 배치
-            text_rect = QRect(
-                pos.x() - self.HOTSPOT_RADIUS, 
-                pos.y() - self.HOTSPOT_RADIUS, 
-                self.HOTSPOT_RADIUS * 2, 
-                self.HOTSPOT_RADIUS * 2
-            )
+            labels.append((QRect(pos.x() - r, pos.y() - r, r * 2, r * 2), font, label))
+        
+        # 원 그리기 (선택된 핫스팟이 위에 오도록 마지막에)
+        styles = (
+            ("normal", self.HOTSPOT_COLOR, self.HOTSPOT_PEN),
+            ("locked", self.HOTSPOT_COLOR, self.HOTSPOT_LOCKED_PEN),
+            ("selected", self.HOTSPOT_SELECTED_COLOR, self.HOTSPOT_SELECTED_PEN),
+        )
+        for style, color, pen in styles:
+            if style in circles:
+                painter.setBrush(color)
+                painter.setPen(pen)
+                painter.drawPath(circles[style])
+        
+        # 텍스트 드로잉 (폰트가 바뀔 때만 setFont 호출)
+        painter.setPen(self.HOTSPOT_TEXT_PEN)
+        current_font = None
+        for text_rect, font, label in labels:
+            if font is not current_font:
+                painter.setFont(font)
+                current_font = font
             painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, label)
     
+    def _hotspot_rect(self, hotspot: Hotspot) -> QRect:
+        """핫스팟이 그려지는 위젯 영역 (외곽선 여유 포함)"""
+        pos = self._image_to_widget_coords(hotspot.x, hotspot.y)
+        margin = self.HOTSPOT_RADIUS + self.HOTSPOT_PAINT_MARGIN
+        return QRect(pos.x() - margin, pos.y() - margin, margin * 2, margin * 2)
+    
+    def _update_geometry(self) -> None:
+        """좌표 변환용 배율/오프셋 계산 (픽스맵 스케일 없이 크기 계산만 수행)"""
+        if not self._pixmap:
+            return
+        
+        ratio = self.devicePixelRatioF()
+        # paintEvent의 스케일 결과와 같은 정수 크기를 얻도록 QSize.scaled 사용
+        scaled = self._pixmap.size().scaled(self.size() * ratio, Qt.AspectRatioMode.KeepAspectRatio)
+        sw = scaled.width() / ratio
+        sh = scaled.height() / ratio
+        self._scale_x = sw / self._pixmap.width()
+        self._scale_y = sh / self._pixmap.height()
+        self._offset_x = (self.width() - sw) // 2
+        self._offset_y = (self.height() - sh) // 2
+    
     def _image_to_widget_coords(self, img_x: int, img_y: int) -> QPoint:
         """이미지 좌표를 위젯 좌표로 변환"""
         if not self._pixmap:
@@ -350,8 +401,10 @@ class ScoreCanvas(QWidget):
             if hotspot:
                 img_coords = self._widget_to_image_coords(pos.x(), pos.y())
                 if img_coords:
+                    # 이전 위치와 새 위치만 다시 그림
+                    old_rect = self._hotspot_rect(hotspot)
                     hotspot.x, hotspot.y = img_coords
-                    self.update()
+                    self.update(old_rect.united(self._hotspot_rect(hotspot)))
         else:
             # 마우스 커서 변경 (핫스팟 위에 있을 때)
             if self._find_hotspot_at(pos):
@@ -382,18 +435,25 @@ class ScoreCanvas(QWidget):
         if not self._score_sheet:
             return None
         
+        # 마우스 이동마다 호출되므로 좌표 변환 값을 지역 변수로 두고 제곱 거리로 비교
+        px, py = pos.x(), pos.y()
+        if self._pixmap:
+            sx, sy, ox, oy = self._scale_x, self._scale_y, self._offset_x, self._offset_y
+        else:
+            sx, sy, ox, oy = 1.0, 1.0, 0, 0
+        # 실제 원보다 약간 더 넓은 범위까지 클릭으로 인정 (작아진 버튼 보완)
+        hit_radius_sq = (self.HOTSPOT_RADIUS + 8) ** 2
+        chorus_only = (self._verse_index == 5)
+        
         for hotspot in self._score_sheet.hotspots:
             # [수정] 후렴 모드(5)인 경우, 후렴 매핑이 있거나 선택된 것만 클릭 가능하도록 일관성 유지
-            if self._verse_index == 5:
+            if chorus_only:
                 if not self.is_hotspot_editable(hotspot, 5) and hotspot.id != self._selected_hotspot_id:
                     continue
-                    
-            hotspot_pos = self._image_to_widget_coords(hotspot.x, hotspot.y)
-            distance = ((pos.x() - hotspot_pos.x()) ** 2 + 
-                       (pos.y() - hotspot_pos.y()) ** 2) ** 0.5
             
-            # 실제 원보다 약간 더 넓은 범위까지 클릭으로 인정 (작아진 버튼 보완)
-            if distance <= self.HOTSPOT_RADIUS + 8:
+            dx = px - int(hotspot.x * sx + ox)
+            dy = py - int(hotspot.y * sy + oy)
+            if dx * dx + dy * dy <= hit_radius_sq:
                 return hotspot
         
         return None
@@ -453,6 +513,7 @@ class ScoreCanvas(QWidget):
             self.hotspot_removed_request.emit(hotspot)
 
     def resizeEvent(self, event) -> None:
-        """창 크기 변경 시 캐시된 이미지 무효화"""
-        self._scaled_pixmap = None
+        """창 크기 변경 시 캐시된 이미지 무효화 및 좌표 변환 갱신"""
+        self._frame_pixmap = None
+        self._update_geometry()
         super().resizeEvent(event)
@@ -265,6 +265,7 @@ class SlidePreviewPanel(QWidget):
         """SlideManager 연결 및 초기화"""
         self._slide_manager = manager
         self._slide_manager.file_changed.connect(self.refresh_slides)
+        self._slide_manager.slide_ready.connect(self._on_slide_ready)
         self.refresh_slides()
         
     def set_editable(self, editable: bool) -> None:
@@ -331,8 +332,8 @@ class SlidePreviewPanel(QWidget):
         mapped_indices = getattr(self, '_mapped_indices', set())
         
         for i in range(count):
-            qimg = self._slide_manager.get_slide_image(i)
-            pixmap = QPixmap.fromImage(qimg)
+            # 메모리에 없는 썸네일은 백그라운드에서 렌더링 후 _on_slide_ready에서 채움 (UI 블로킹 방지)
+            qimg = self._slide_manager.get_slide_image_async(i)
             
             is_mapped = i in mapped_indices
             label = f"Slide {i+1}"
@@ -340,9 +341,8 @@ class SlidePreviewPanel(QWidget):
                 label += " (🔗)"
                 
             item = QListWidgetItem(label)
-            # 고품질 스케일링을 미리 수행하여 리스트 렌더링 부하 감소
-            scaled_pixmap = pixmap.scaled(160, 90, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            item.setIcon(QIcon(scaled_pixmap))
+            if qimg is not None:
+                item.setIcon(self._thumbnail_icon(qimg))
             item.setData(Qt.ItemDataRole.UserRole, i)
             
             if is_mapped:
@@ -350,6 +350,18 @@ class SlidePreviewPanel(QWidget):
             
             self._list.addItem(item)
             
+    def _thumbnail_icon(self, qimg) -> QIcon:
+        """썸네일 아이콘 생성 (고품질 스케일링을 미리 수행하여 리스트 렌더링 부하 감소)"""
+        pixmap = QPixmap.fromImage(qimg)
+        scaled_pixmap = pixmap.scaled(160, 90, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        return QIcon(scaled_pixmap)
+
+    def _on_slide_ready(self, index: int, qimg) -> None:
+        """백그라운드 렌더링이 끝난 슬라이드의 썸네일 표시"""
+        item = self._list.item(index)
+        if item is not None and item.data(Qt.ItemDataRole.UserRole) == index:
+            item.setIcon(self._thumbnail_icon(qimg))
+            
     def _on_current_item_changed(self, current: QListWidgetItem, previous: QListWidgetItem) -> None:
         """방향키 등을 통한 선택 변경 대응"""
         if current:
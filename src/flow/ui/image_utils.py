@@ -0,0 +1,26 @@
+"""이미지 표시용 헬퍼
+
+큰 이미지를 화면 크기로 줄일 때 사용하는 스케일링 유틸리티
+"""
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QPixmap
+
+# 이 배율보다 크게 줄여야 하면 빠른 축소를 먼저 수행
+_PRESCALE_FACTOR = 4
+
+
+def smart_scale(
+    pixmap: QPixmap,
+    target_size: QSize,
+    aspect: Qt.AspectRatioMode = Qt.AspectRatioMode.KeepAspectRatio,
+) -> QPixmap:
+    """큰 이미지는 빠른 축소 후 부드러운 축소로 마무리 (화질은 거의 같고 훨씬 빠름)"""
+    if (pixmap.width() > target_size.width() * _PRESCALE_FACTOR
+            or pixmap.height() > target_size.height() * _PRESCALE_FACTOR):
+        pixmap = pixmap.scaled(
+            target_size * _PRESCALE_FACTOR,
+            aspect,
+            Qt.TransformationMode.FastTransformation
+        )
+    return pixmap.scaled(target_size, aspect, Qt.TransformationMode.SmoothTransformation)
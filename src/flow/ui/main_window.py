@@ -29,6 +29,7 @@ from flow.ui.editor.song_list_widget import SongListWidget
 from flow.ui.editor.score_canvas import ScoreCanvas
 from flow.ui.editor.slide_preview_panel import SlidePreviewPanel
 from flow.ui.display.display_window import DisplayWindow
+from flow.ui.image_utils import smart_scale
 from flow.services.slide_manager import SlideManager
 from flow.services.config_service import ConfigService
 from flow.ui.project_launcher import ProjectLauncher
@@ -48,8 +49,17 @@ class MainWindow(QMainWindow):
         # 송출 관련
         self._display_window: DisplayWindow | None = None
         self._slide_manager = SlideManager()
+        self._apply_slide_render_size()
+        # 시작 후 프로젝터 등을 연결/해제하면 렌더링 해상도를 다시 맞춤
+        app = QtGui.QGuiApplication.instance()
+        app.screenAdded.connect(self._apply_slide_render_size)
+        # (screenRemoved는 목록에서 빠지기 전에 발생하므로 다음 이벤트 루프에서 계산)
+        app.screenRemoved.connect(
+            lambda _: QTimer.singleShot(0, self._apply_slide_render_size)
+        )
         from flow.ui.live.live_controller import LiveController
         self._live_controller = LiveController(self, slide_manager=self._slide_manager)
+        self._preview_slide_index: int | None = None  # 프리뷰에 표시하려는 슬라이드 (비동기 렌더링 대기용)
         
         # Undo/Redo 관련
         self._undo_stack = QUndoStack(self)
@@ -275,7 +285,7 @@ class MainWindow(QMainWindow):
 
         self._preview_image = QLabel()
         self._preview_image.setFixedSize(256, 144) # [수정] 고정 크기(16:9)로 초기 팽창 문제 완전 해결
-        self._preview_image.setScaledContents(True) # Qt가 자동으로 비율 맞춤 스케일링
+        self._preview_image.setScaledContents(False) # 이미지는 _thumbnail_pixmap에서 미리 스케일링
         self._preview_image.setStyleSheet("background-color: black; border: 1px solid #333; border-radius: 4px;")
         self._preview_image.setAlignment(Qt.AlignmentFlag.AlignCenter)
         preview_layout.addWidget(self._preview_image, 0, Qt.AlignmentFlag.AlignCenter)
@@ -317,7 +327,7 @@ class MainWindow(QMainWindow):
 
         self._live_image = QLabel()
         self._live_image.setFixedSize(256, 144) # [수정] 고정 크기(16:9)
-        self._live_image.setScaledContents(True)
+        self._live_image.setScaledContents(False)
         self._live_image.setStyleSheet("background-color: #000; border: 1px solid #883333; border-radius: 4px;")
         self._live_image.setAlignment(Qt.AlignmentFlag.AlignCenter)
         live_layout.addWidget(self._live_image, 0, Qt.AlignmentFlag.AlignCenter)
@@ -639,6 +649,8 @@ class MainWindow(QMainWindow):
         self._slide_manager.load_finished.connect(self._on_ppt_load_finished)
         self._slide_manager.load_error.connect(self._on_ppt_load_error)
         self._slide_manager.load_progress.connect(self._on_ppt_load_progress)
+        # 백그라운드 렌더링이 끝난 슬라이드를 프리뷰에 반영
+        self._slide_manager.slide_ready.connect(self._on_slide_ready)
         
         # 프로젝트 변경 감지 시그널 (SongListWidget)
         self._song_list.song_added.connect(self._on_song_added)
@@ -956,6 +968,17 @@ class MainWindow(QMainWindow):
         self.setFocus()
         self._statusbar.showMessage("라이브 모드 - F11로 송출 시작")
     
+    def _apply_slide_render_size(self, *_) -> None:
+        """가장 큰 모니터의 실제 픽셀 크기에 맞춰 슬라이드 렌더링 해상도 설정"""
+        screens = QtGui.QGuiApplication.screens()
+        if not screens:
+            return
+        screen = max(screens, key=lambda s: s.size().width() * s.size().height())
+        ratio = screen.devicePixelRatio()
+        self._slide_manager.set_target_size(
+            int(screen.size().width() * ratio), int(screen.size().height() * ratio)
+        )
+    
     def _toggle_display(self) -> None:
         """송출 시작/중지 토글"""
         if self._display_window and self._display_window.isVisible():
@@ -1246,6 +1269,7 @@ class MainWindow(QMainWindow):
         """미리보기 업데이트"""
         text = "(선택된 핫스팟 없음)"
         show_img = False
+        self._preview_slide_index = None
         
         if hotspot:
             lyric = getattr(hotspot, 'lyric', "")
@@ -1266,11 +1290,8 @@ class MainWindow(QMainWindow):
             
             # 매핑된 슬라이드 이미지가 있다면 프리뷰에 표시
             if slide_idx >= 0:
-                from PySide6.QtGui import QPixmap
                 try:
-                    qimg = self._slide_manager.get_slide_image(slide_idx)
-                    pixmap = QtGui.QPixmap.fromImage(qimg)
-                    self._preview_image.setPixmap(pixmap) # setScaledContents(True)로 자동 스케일링
+                    self._show_preview_slide(slide_idx)
                     show_img = True
                 except Exception:
                     pass
@@ -1293,9 +1314,7 @@ class MainWindow(QMainWindow):
         """슬라이드 이미지 변경됨 - 메인 윈도우와 송출창 업데이트"""
         self._current_live_image = image # [추가] 리사이징 대응을 위해 현재 이미지 보관
         if image:
-            from PySide6.QtGui import QPixmap
-            pixmap = QPixmap.fromImage(image)
-            self._live_image.setPixmap(pixmap) # setScaledContents(True)로 자동 스케일링
+            self._live_image.setPixmap(self._thumbnail_pixmap(image, self._live_image))
             self._live_image.show()
         else:
             self._live_image.hide()
@@ -1613,13 +1632,37 @@ class MainWindow(QMainWindow):
         """인덱스로 직접 프리뷰 이미지 갱신 (핫스팟 없을 때)"""
         self._last_preview_index = index # 상태 저장
         try:
-            qimg = self._slide_manager.get_slide_image(index)
-            pixmap = QtGui.QPixmap.fromImage(qimg)
-            self._preview_image.setPixmap(pixmap) # setScaledContents(True)로 자동 스케일링
+            self._show_preview_slide(index)
             self._preview_image.show()
             self._preview_text.setText(f"#{index + 1} (미매핑)")
         except Exception:
             pass
+
+    def _show_preview_slide(self, index: int) -> None:
+        """프리뷰에 슬라이드 표시 (메모리에 없으면 백그라운드 렌더링 후 _on_slide_ready에서 표시)"""
+        self._preview_slide_index = index
+        qimg = self._slide_manager.get_slide_image_async(index)
+        if qimg is not None:
+            self._preview_image.setPixmap(self._thumbnail_pixmap(qimg, self._preview_image))
+        else:
+            self._preview_image.clear()  # 이전 슬라이드가 남아 보이지 않도록 비움
+
+    def _on_slide_ready(self, index: int, image) -> None:
+        """백그라운드 렌더링 완료 - 기다리던 프리뷰 슬라이드면 표시"""
+        if index == self._preview_slide_index:
+            self._preview_image.setPixmap(self._thumbnail_pixmap(image, self._preview_image))
+
+    def _thumbnail_pixmap(self, image, label: QLabel) -> QPixmap:
+        """고정 크기 미리보기 라벨에 맞춰 한 번만 스케일한 픽스맵 생성 (그릴 때마다 스케일하지 않음)"""
+        label.ensurePolished()  # 스타일시트 테두리가 반영된 내용 영역 사용
+        ratio = label.devicePixelRatioF()
+        pixmap = smart_scale(
+            QPixmap.fromImage(image),
+            label.contentsRect().size() * ratio,
+            Qt.AspectRatioMode.IgnoreAspectRatio
+        )
+        pixmap.setDevicePixelRatio(ratio)
+        return pixmap
     
     # === 키보드 이벤트 ===
     
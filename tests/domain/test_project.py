@@ -185,6 +185,7 @@ class TestProjectSerialization:
         project = Project.from_dict(data)
         
         assert project.id == "project-123"
+        assert project.find_score_sheet_by_id("s2") is project.score_sheets[1]
         assert project.name == "복원된 프로젝트"
         assert project.pptx_path == "/home/user/presentation.pptx"
         assert len(project.score_sheets) == 2
@@ -87,6 +87,17 @@ class TestScoreSheetHotspotManagement:
         found = sheet.find_hotspot_by_id("nonexistent-id")
         
         assert found is None
+    
+    def test_removed_hotspot_is_not_found(self):
+        """제거된 핫스팟은 더 이상 찾을 수 없음"""
+        sheet = ScoreSheet(name="테스트")
+        hotspot = Hotspot(x=100, y=200)
+        sheet.add_hotspot(hotspot)
+        
+        sheet.remove_hotspot(hotspot.id)
+        
+        assert sheet.find_hotspot_by_id(hotspot.id) is None
+        assert sheet.remove_hotspot(hotspot.id) is False
 
 
 class TestScoreSheetNavigation:
@@ -129,6 +140,49 @@ class TestScoreSheetNavigation:
         
         assert prev_hotspot == h1
     
+    def test_insert_hotspot_at_index_keeps_navigation_order(self):
+        """중간 삽입 후에도 순서 및 이전/다음 탐색이 유지됨"""
+        sheet = ScoreSheet(name="테스트")
+        h1 = Hotspot(x=100, y=200)
+        h2 = Hotspot(x=200, y=300)
+        sheet.add_hotspot(h1)
+        sheet.add_hotspot(h2)
+        
+        inserted = Hotspot(x=150, y=250)
+        sheet.add_hotspot(inserted, index=1)
+        
+        assert sheet.get_ordered_hotspots() == [h1, inserted, h2]
+        assert [h.order for h in sheet.get_ordered_hotspots()] == [0, 1, 2]
+        assert sheet.get_next_hotspot(h1.id) is inserted
+        assert sheet.get_previous_hotspot(h2.id) is inserted
+    
+    def test_remove_hotspot_closes_order_gap(self):
+        """삭제 후 순서 번호가 빈자리 없이 당겨짐"""
+        sheet = ScoreSheet(name="테스트")
+        h1, h2, h3 = Hotspot(x=1, y=1), Hotspot(x=2, y=2), Hotspot(x=3, y=3)
+        for h in (h1, h2, h3):
+            sheet.add_hotspot(h)
+        
+        sheet.remove_hotspot(h2.id)
+        
+        assert [h.order for h in sheet.get_ordered_hotspots()] == [0, 1]
+        assert sheet.get_next_hotspot(h1.id) is h3
+        assert sheet.find_hotspot_by_id(h3.id) is h3
+    
+    def test_from_dict_sorts_hotspots_by_order(self):
+        """저장된 순서가 섞여 있어도 order 기준으로 탐색됨"""
+        sheet = ScoreSheet.from_dict({
+            "id": "s",
+            "name": "곡",
+            "hotspots": [
+                {"id": "b", "x": 0, "y": 0, "order": 1},
+                {"id": "a", "x": 0, "y": 0, "order": 0},
+            ],
+        })
+        
+        assert [h.id for h in sheet.get_ordered_hotspots()] == ["a", "b"]
+        assert sheet.get_next_hotspot("a").id == "b"
+    
     def test_get_next_hotspot_at_end_returns_none(self):
         """마지막 핫스팟에서 다음은 None"""
         sheet = ScoreSheet(name="테스트")
@@ -170,3 +224,19 @@ class TestScoreSheetSerialization:
         assert sheet.id == "test-sheet-id"
         assert sheet.name == "복원된 시트"
         assert len(sheet.hotspots) == 1
+        assert sheet.find_hotspot_by_id("h1") is sheet.hotspots[0]
+
+    def test_from_dict_accepts_null_strings(self):
+        """문자열 필드가 null로 저장된 파일도 빈 문자열로 로드"""
+        data = {
+            "id": "s",
+            "name": None,
+            "image_path": None,
+            "pptx_path": None,
+            "hotspots": [{"id": "h1", "x": 0, "y": 0, "lyric": None}],
+        }
+
+        sheet = ScoreSheet.from_dict(data)
+
+        assert (sheet.name, sheet.image_path, sheet.pptx_path) == ("", "", "")
+        assert sheet.hotspots[0].lyric == ""
@@ -0,0 +1,44 @@
+"""JSON 직렬화 헬퍼 테스트"""
+
+import json
+
+import pytest
+
+from flow.domain import serialization
+from flow.domain.hotspot import Hotspot
+from flow.domain.project import Project
+from flow.domain.score_sheet import ScoreSheet
+
+
+class TestSerialization:
+    """dumps/loads 왕복 테스트"""
+
+    def test_round_trip_project(self):
+        """프로젝트 딕셔너리가 그대로 복원됨"""
+        project = Project(name="테스트")
+        sheet = ScoreSheet(name="곡1")
+        hotspot = Hotspot(x=10, y=20, lyric="가사")
+        hotspot.set_slide_index(3, verse_index=5)
+        sheet.add_hotspot(hotspot)
+        project.add_score_sheet(sheet)
+
+        data = serialization.loads(serialization.dumps(project.to_dict()))
+
+        assert data == project.to_dict()
+
+    def test_dumps_keeps_non_ascii(self):
+        """한글은 이스케이프 없이 UTF-8로 저장됨"""
+        raw = serialization.dumps({"name": "주 품에"})
+
+        assert "주 품에".encode("utf-8") in raw
+
+    def test_loads_accepts_bom(self):
+        """UTF-8 BOM이 붙은 데이터도 로드됨"""
+        raw = b"\xef\xbb\xbf" + serialization.dumps({"a": 1})
+
+        assert serialization.loads(raw) == {"a": 1}
+
+    def test_loads_invalid_raises_json_error(self):
+        """잘못된 JSON은 json.JSONDecodeError 계열 예외"""
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads(b"{ invalid json }")
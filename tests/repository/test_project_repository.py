@@ -5,6 +5,7 @@ TDD RED 단계: 실패하는 테스트 먼저 작성
 
 import pytest
 import json
+import os
 from pathlib import Path
 from flow.repository.project_repository import ProjectRepository
 from flow.domain.project import Project
@@ -53,6 +54,18 @@ class TestProjectRepositorySave:
         
         assert new_dir.exists()
         assert file_path.exists()
+    
+    def test_save_overwrites_without_leftover_temp_file(self, tmp_path: Path):
+        """덮어쓰기 저장 후 임시 파일이 남지 않음"""
+        repo = ProjectRepository(tmp_path)
+        project = Project(name="처음")
+        file_path = repo.save(project)
+        
+        project.name = "수정됨"
+        repo.save(project, file_path)
+        
+        assert repo.load(file_path).name == "수정됨"
+        assert list(tmp_path.glob("*.tmp")) == []
 
 
 class TestProjectRepositoryLoad:
@@ -84,6 +97,65 @@ class TestProjectRepositoryLoad:
         
         assert loaded.id == original_id
     
+    def test_image_paths_round_trip_as_relative(self, tmp_path: Path):
+        """프로젝트 폴더 안의 이미지는 상대 경로로 저장되고 절대 경로로 복구됨"""
+        image = tmp_path / "images" / "song1.png"
+        image.parent.mkdir()
+        image.touch()
+        repo = ProjectRepository(tmp_path)
+        project = Project(name="테스트")
+        project.add_score_sheet(ScoreSheet(name="곡1", image_path=str(image)))
+        project.add_score_sheet(ScoreSheet(name="곡2", image_path=str(image)))
+        
+        file_path = repo.save(project, tmp_path / "project.json")
+        saved = json.loads(file_path.read_text(encoding="utf-8"))
+        loaded = repo.load(file_path)
+        
+        assert saved["score_sheets"][0]["image_path"] == str(Path("images") / "song1.png")
+        assert loaded.score_sheets[0].image_path == str(image.resolve())
+        assert loaded.score_sheets[1].image_path == str(image.resolve())
+    
+    def test_image_outside_project_folder_stays_absolute(self, tmp_path: Path):
+        """이름만 비슷한 옆 폴더의 이미지는 상대 경로로 바뀌지 않음"""
+        project_dir = tmp_path / "proj"
+        image = tmp_path / "proj_images" / "song1.png"
+        image.parent.mkdir()
+        image.touch()
+        repo = ProjectRepository(project_dir)
+        project = Project(name="테스트")
+        project.add_score_sheet(ScoreSheet(name="곡1", image_path=str(image)))
+        
+        file_path = repo.save(project, project_dir / "project.json")
+        saved = json.loads(file_path.read_text(encoding="utf-8"))
+        
+        assert saved["score_sheets"][0]["image_path"] == str(image)
+    
+    def test_missing_image_falls_back_to_project_folder(self, tmp_path: Path):
+        """이동된 이미지는 프로젝트 폴더의 같은 파일명으로 복구됨"""
+        (tmp_path / "moved.png").touch()
+        repo = ProjectRepository(tmp_path)
+        project = Project(name="테스트")
+        project.add_score_sheet(ScoreSheet(name="곡1", image_path="/old/place/moved.png"))
+        
+        file_path = repo.save(project, tmp_path / "project.json")
+        loaded = repo.load(file_path)
+        
+        assert loaded.score_sheets[0].image_path == str(tmp_path.resolve() / "moved.png")
+    
+    def test_load_legacy_file_with_bom(self, tmp_path: Path):
+        """UTF-8 BOM으로 저장된 이전 버전 파일도 로드됨"""
+        repo = ProjectRepository(tmp_path)
+        project = Project(name="이전 프로젝트")
+        legacy_file = tmp_path / "legacy.json"
+        legacy_file.write_text(
+            json.dumps(project.to_dict(), ensure_ascii=False, indent=2),
+            encoding="utf-8-sig",
+        )
+        
+        loaded = repo.load(legacy_file)
+        
+        assert loaded.name == "이전 프로젝트"
+    
     def test_load_nonexistent_file_raises_error(self, tmp_path: Path):
         """존재하지 않는 파일 로드 시 에러"""
         repo = ProjectRepository(tmp_path)
@@ -121,6 +193,31 @@ class TestProjectRepositoryList:
         projects = repo.list_projects()
         
         assert len(projects) == 2
+    
+    def test_list_projects_reflects_new_and_deleted_files(self, tmp_path: Path):
+        """저장/삭제 후 다시 조회하면 목록이 갱신됨"""
+        repo = ProjectRepository(tmp_path)
+        first = repo.save(Project(name="프로젝트1"))
+        assert [p.name for p in repo.list_projects()] == [first.name]
+        
+        second = repo.save(Project(name="프로젝트2"))
+        assert sorted(p.name for p in repo.list_projects()) == sorted([first.name, second.name])
+        
+        repo.delete(first)
+        assert [p.name for p in repo.list_projects()] == [second.name]
+
+    def test_list_projects_rescans_when_mtime_is_too_recent(self, tmp_path: Path):
+        """폴더 시각이 그대로여도 방금 바뀐 폴더면 외부에서 추가한 파일이 보임"""
+        repo = ProjectRepository(tmp_path)
+        repo.save(Project(name="프로젝트1"))
+        stat = os.stat(tmp_path)
+        assert len(repo.list_projects()) == 1
+
+        # 시각 해상도가 거친 파일 시스템처럼 폴더 mtime이 바뀌지 않은 상황 재현
+        (tmp_path / "external.json").write_bytes(b"{}")
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert len(repo.list_projects()) == 2
 
 
 class TestProjectRepositoryDelete:
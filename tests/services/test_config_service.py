@@ -1,5 +1,6 @@
 import pytest
 import json
+import os
 from pathlib import Path
 from flow.services.config_service import ConfigService
 
@@ -37,6 +38,27 @@ class TestConfigServicePathNormalization:
         config_service.add_recent_project("/non/existent/path.json")
         assert len(config_service.get_recent_projects()) == 0
 
+    def test_relative_path_is_stored_as_absolute(self, config_service, tmp_path, monkeypatch):
+        """상대 경로는 현재 작업 폴더 기준 절대 경로로 저장됨"""
+        (tmp_path / "rel.json").touch()
+        monkeypatch.chdir(tmp_path)
+        
+        config_service.add_recent_project("rel.json")
+        
+        assert config_service.get_recent_projects() == [(tmp_path / "rel.json").as_posix()]
+
+    def test_symlink_and_real_path_share_one_entry(self, config_service, tmp_path):
+        """심볼릭 링크로 연 프로젝트는 실제 경로와 같은 항목으로 취급됨"""
+        real = tmp_path / "real.json"
+        real.touch()
+        link = tmp_path / "link.json"
+        link.symlink_to(real)
+
+        config_service.add_recent_project(str(link))
+        config_service.add_recent_project(str(real))
+
+        assert config_service.get_recent_projects() == [real.resolve().as_posix()]
+
 class TestConfigServiceRecentProjects:
     """최근 프로젝트 목록 관리 테스트"""
     
@@ -101,3 +123,42 @@ class TestConfigServicePersistence:
         new_service.load()
         
         assert path_str in new_service.get_recent_projects()
+
+    def test_load_picks_up_external_change(self, config_service, tmp_path):
+        """다른 인스턴스가 설정 파일을 바꾸면 다시 읽어옴"""
+        p1 = tmp_path / "p1.json"
+        p1.touch()
+        config_service.add_recent_project(str(p1))
+        assert config_service.get_recent_projects() == [p1.as_posix()]
+        
+        config_service._config_file.write_text(
+            json.dumps({"recent_projects": []}), encoding="utf-8"
+        )
+        stat = config_service._config_file.stat()
+        os.utime(config_service._config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert config_service.get_recent_projects() == []
+
+    def test_load_skips_unchanged_file(self, config_service, tmp_path):
+        """파일이 바뀌지 않았으면 다시 파싱하지 않음"""
+        p1 = tmp_path / "p1.json"
+        p1.touch()
+        config_service.add_recent_project(str(p1))
+        config_service.load()
+        
+        # 메모리 상의 값만 바꿔 두면, 재로드 시 덮어쓰이지 않아야 함
+        config_service._config["recent_projects"] = []
+        config_service.load()
+        
+        assert config_service._config["recent_projects"] == []
+
+    def test_save_does_not_trigger_reload(self, config_service, tmp_path):
+        """자기가 저장한 파일은 다음 load()에서 다시 파싱하지 않음"""
+        p1 = tmp_path / "p1.json"
+        p1.touch()
+        config_service.add_recent_project(str(p1))
+        
+        config_service._config["recent_projects"] = []
+        config_service.load()
+        
+        assert config_service._config["recent_projects"] == []
@@ -0,0 +1,133 @@
+"""SlideConverter 단위 테스트"""
+
+import os
+import shutil
+import time
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import fitz
+import pytest
+
+from flow.services import slide_converter
+from flow.services.slide_converter import LinuxSlideConverter
+
+
+def _fake_libreoffice(page_count: int):
+    """LibreOffice 대신 page_count쪽 PDF를 --outdir에 만들어 주는 가짜 실행기"""
+    calls = []
+
+    def run(cmd):
+        calls.append(cmd)
+        outdir = cmd[cmd.index("--outdir") + 1]
+        doc = fitz.open()
+        for _ in range(page_count):
+            doc.new_page(width=320, height=180)
+        doc.save(os.path.join(outdir, Path(cmd[-1]).stem + ".pdf"))
+        doc.close()
+
+    return run, calls
+
+
+@pytest.fixture
+def converter(tmp_path):
+    """임시 폴더를 캐시로 쓰는 LibreOffice 변환기"""
+    converter = LinuxSlideConverter()
+    converter._cache_dir = tmp_path / "cache"
+    converter._cache_dir.mkdir()
+    return converter
+
+
+class TestLibreOfficeConversion:
+    """캐시 미스/적중 동작 검증"""
+
+    def test_cache_miss_converts_then_hit_reuses_png(self, converter, tmp_path):
+        """처음 요청은 변환하고, 같은 슬라이드 재요청은 변환 없이 캐시에서 반환"""
+        pptx_path = tmp_path / "deck.pptx"
+        pptx_path.write_bytes(b"dummy")
+        run, calls = _fake_libreoffice(page_count=2)
+
+        with patch.object(slide_converter, "_run_converter", side_effect=run):
+            first = converter.convert_slide(pptx_path, 1)
+            second = converter.convert_slide(pptx_path, 1)
+
+        assert first is not slide_converter._FALLBACK_IMAGE
+        assert not first.isNull()
+        assert not second.isNull()
+        assert len(calls) == 1
+
+    def test_missing_slide_returns_fallback(self, converter, tmp_path):
+        """없는 슬라이드 번호는 검은 화면을 반환하고 덱 변환을 반복하지 않음"""
+        pptx_path = tmp_path / "deck.pptx"
+        pptx_path.write_bytes(b"dummy")
+        run, calls = _fake_libreoffice(page_count=1)
+
+        with patch.object(slide_converter, "_run_converter", side_effect=run):
+            converter.convert_slide(pptx_path, 0)
+            image = converter.convert_slide(pptx_path, 5)
+
+        assert image is slide_converter._FALLBACK_IMAGE
+        assert len(calls) == 1
+
+    def test_deleted_cache_is_converted_again(self, converter, tmp_path):
+        """캐시 폴더가 밖에서 지워지면 빈 이미지 대신 다시 변환해서 반환"""
+        pptx_path = tmp_path / "deck.pptx"
+        pptx_path.write_bytes(b"dummy")
+        run, calls = _fake_libreoffice(page_count=1)
+
+        with patch.object(slide_converter, "_run_converter", side_effect=run):
+            converter.convert_slide(pptx_path, 0)
+            shutil.rmtree(converter._cache_dir)
+            converter._cache_dir.mkdir()
+            image = converter.convert_slide(pptx_path, 0)
+
+        assert not image.isNull()
+        assert image is not slide_converter._FALLBACK_IMAGE
+        assert len(calls) == 2
+
+
+class TestStaleCachePruning:
+    """오래된 덱 캐시 정리 검증"""
+
+    def test_prune_uses_last_access_time(self, tmp_path):
+        """처음 만든 지 오래됐어도 최근에 사용한 덱은 남기고, 안 쓴 덱만 삭제"""
+        old = time.time() - slide_converter._CACHE_MAX_AGE_SEC - 60
+        used = tmp_path / "used"
+        unused = tmp_path / "unused"
+        for deck in (used, unused):
+            deck.mkdir()
+            os.utime(deck, (old, old))
+
+        slide_converter._touch_deck(str(used))
+        slide_converter._prune_stale_caches.__wrapped__(tmp_path)
+
+        assert used.exists()
+        assert not unused.exists()
+
+
+class TestDeckKey:
+    """덱 캐시 키 검증"""
+
+    def test_target_size_changes_deck_key(self, tmp_path):
+        """표시 영역 크기가 다르면 다른 캐시 폴더를 사용"""
+        pptx_path = tmp_path / "deck.pptx"
+        pptx_path.write_bytes(b"dummy")
+
+        small = slide_converter._deck_key("lo_v2", pptx_path, (1280, 720))
+        large = slide_converter._deck_key("lo_v2", pptx_path, (3840, 2160))
+
+        assert small != large
+        assert small == slide_converter._deck_key("lo_v2", pptx_path, (1280, 720))
+
+    def test_touch_only_save_keeps_deck_key(self, tmp_path):
+        """내용 없이 저장 시각만 바뀌면 같은 캐시 폴더를 계속 사용"""
+        pptx_path = tmp_path / "deck.pptx"
+        with zipfile.ZipFile(pptx_path, "w") as z:
+            z.writestr("ppt/presentation.xml", "<p/>")
+        before = slide_converter._deck_key("lo_v2", pptx_path)
+
+        stat = pptx_path.stat()
+        os.utime(pptx_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert slide_converter._deck_key("lo_v2", pptx_path) == before
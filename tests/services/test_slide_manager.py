@@ -7,6 +7,13 @@ from pathlib import Path
 # 우리가 만들 클래스
 from flow.services.slide_manager import SlideManager
 
+# presentation.xml 테스트 데이터용 네임스페이스 선언
+_PRESENTATION_NS = (
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main"'
+)
+
 class TestSlideManager:
     """SlideManager의 요구사항 검증"""
     
@@ -48,6 +55,176 @@ class TestSlideManager:
         assert isinstance(image, QImage)
         assert image.width() == 100
 
+    def test_count_slides_reads_presentation_xml(self, tmp_path):
+        """presentation.xml의 슬라이드 목록만으로 개수를 셀 수 있어야 함"""
+        import zipfile
+        from flow.services.slide_manager import _count_slides
+        
+        pptx_path = tmp_path / "deck.pptx"
+        with zipfile.ZipFile(pptx_path, "w") as z:
+            z.writestr(
+                "ppt/presentation.xml",
+                f'<p:presentation {_PRESENTATION_NS}><p:sldIdLst>'
+                '<p:sldId id="256" r:id="rId2"/><p:sldId id="257" r:id="rId3"/>'
+                '</p:sldIdLst></p:presentation>',
+            )
+        
+        assert _count_slides(pptx_path) == 2
+        
+    def test_count_slides_ignores_section_entries(self, tmp_path):
+        """구역(section) 확장의 p14:sldId는 슬라이드 개수에 포함하지 않아야 함"""
+        import zipfile
+        from flow.services.slide_manager import _count_slides
+        
+        pptx_path = tmp_path / "deck.pptx"
+        with zipfile.ZipFile(pptx_path, "w") as z:
+            z.writestr(
+                "ppt/presentation.xml",
+                f'<p:presentation {_PRESENTATION_NS}><p:sldIdLst>'
+                '<p:sldId id="256" r:id="rId2"/><p:sldId id="257" r:id="rId3"/>'
+                '</p:sldIdLst><p:sldSz cx="12192000" cy="6858000"/><p:extLst>'
+                '<p:ext uri="{521415D9-36F7-43E2-AB2F-B90AF26B5E84}"><p14:sectionLst>'
+                '<p14:section name="기본 구역" id="{00000000-0000-0000-0000-000000000000}">'
+                '<p14:sldIdLst><p14:sldId id="256"/><p14:sldId id="257"/></p14:sldIdLst>'
+                '</p14:section></p14:sectionLst></p:ext></p:extLst></p:presentation>',
+            )
+        
+        assert _count_slides(pptx_path) == 2
+        
+    def test_count_slides_returns_none_for_non_zip(self, tmp_path):
+        """ZIP이 아닌 파일은 None (python-pptx 경로로 대체)"""
+        from flow.services.slide_manager import _count_slides
+        
+        bad = tmp_path / "bad.pptx"
+        bad.write_text("dummy")
+        
+        assert _count_slides(bad) is None
+
+    def test_get_slide_image_uses_memory_cache(self):
+        """같은 슬라이드를 다시 요청하면 변환기를 다시 호출하지 않아야 함"""
+        mock_converter = MagicMock()
+        manager = SlideManager(converter=mock_converter)
+        
+        first = manager.get_slide_image(0)
+        second = manager.get_slide_image(0)
+        
+        assert first is second
+        mock_converter.convert_slide.assert_called_once()
+        
+        # 파일 변경 시 캐시가 비워져 다시 변환
+        manager.file_changed.emit()
+        manager.get_slide_image(0)
+        assert mock_converter.convert_slide.call_count == 2
+
+    def test_failed_conversion_is_not_cached(self):
+        """변환 실패(검은 화면)는 캐시하지 않고 다음 요청 때 다시 변환해야 함"""
+        from flow.services.slide_converter import _FALLBACK_IMAGE
+        
+        mock_converter = MagicMock()
+        mock_converter.convert_slide.return_value = _FALLBACK_IMAGE
+        manager = SlideManager(converter=mock_converter)
+        
+        manager.get_slide_image(0)
+        manager.get_slide_image(0)
+        
+        assert mock_converter.convert_slide.call_count == 2
+
+    def test_get_slide_image_async_renders_in_background(self):
+        """캐시에 없으면 None을 반환하고 백그라운드에서 렌더링해 캐시에 넣어야 함"""
+        from PySide6.QtGui import QImage
+        
+        mock_converter = MagicMock()
+        mock_converter.convert_slide.return_value = QImage(10, 10, QImage.Format.Format_RGB32)
+        manager = SlideManager(converter=mock_converter)
+        
+        assert manager.get_slide_image_async(1) is None
+        manager._render_pool.waitForDone()
+        
+        assert manager.get_slide_image_async(1) is not None
+        mock_converter.convert_slide.assert_called_once_with(None, 1)
+
+    def test_async_request_during_prefetch_emits_slide_ready(self):
+        """미리 읽기 중인 슬라이드를 비동기로 요청하면 완료 시 slide_ready가 발생해야 함"""
+        from PySide6.QtGui import QImage
+        
+        manager = SlideManager(converter=MagicMock())
+        manager._pending_renders[(None, 3)] = False  # 미리 읽기 진행 중
+        received = []
+        manager.slide_ready.connect(lambda index, image: received.append(index))
+        
+        assert manager.get_slide_image_async(3) is None
+        manager._on_slide_rendered(None, 3, QImage(10, 10, QImage.Format.Format_RGB32))
+        
+        assert received == [3]
+
+    def test_get_slide_image_prefetches_neighbours(self):
+        """슬라이드 요청 시 주변 슬라이드를 미리 변환해 두어야 함"""
+        mock_converter = MagicMock()
+        manager = SlideManager(converter=mock_converter)
+        manager._slide_count = 5
+        
+        manager.get_slide_image(2)
+        manager._render_pool.waitForDone()
+        
+        requested = sorted(call.args[1] for call in mock_converter.convert_slide.call_args_list)
+        assert requested == [1, 2, 3, 4]
+
+    def test_set_target_size_forwards_to_converter(self):
+        """표시 크기 설정이 변환기로 전달되어야 함"""
+        mock_converter = MagicMock()
+        manager = SlideManager(converter=mock_converter)
+        
+        manager.set_target_size(1920, 1080)
+        
+        mock_converter.set_target_size.assert_called_once_with(1920, 1080)
+
+    def test_target_size_change_drops_cached_images(self):
+        """표시 크기가 바뀌면 이전 해상도의 메모리 이미지를 다시 렌더링해야 함"""
+        mock_converter = MagicMock()
+        manager = SlideManager(converter=mock_converter)
+        manager.set_target_size(1280, 720)
+        manager._render_slide(None, 0)
+
+        manager.set_target_size(1280, 720)
+        manager._render_slide(None, 0)
+        assert mock_converter.convert_slide.call_count == 1
+
+        manager.set_target_size(3840, 2160)
+        manager._render_slide(None, 0)
+        assert mock_converter.convert_slide.call_count == 2
+
+    def test_load_pptx_queues_other_path_while_loading(self, tmp_path):
+        """로딩 중 같은 파일 요청은 무시하고, 다른 파일 요청은 대기시켜야 함"""
+        manager = SlideManager(converter=MagicMock())
+        worker = MagicMock()
+        worker.isRunning.return_value = True
+        worker.path = tmp_path / "a.pptx"
+        manager._load_worker = worker
+        
+        manager.load_pptx(tmp_path / "b.pptx")
+        assert manager._pending_load == tmp_path / "b.pptx"
+        
+        manager.load_pptx(tmp_path / "a.pptx")
+        assert manager._pending_load is None
+
+    def test_pending_load_starts_without_blocking_on_worker(self, tmp_path):
+        """이전 스레드가 끝난 뒤 대기 요청을 시작하고, UI 스레드에서 wait()하지 않음"""
+        manager = SlideManager(converter=MagicMock())
+        old_worker = MagicMock()
+        old_worker.isRunning.return_value = False
+        manager._load_worker = old_worker
+        manager._pending_load = tmp_path / "b.pptx"
+
+        with patch("flow.services.slide_manager.PPTLoadWorker") as worker_cls:
+            manager._start_pending_load()
+
+        old_worker.wait.assert_not_called()
+        worker_cls.assert_called_once_with(manager, tmp_path / "b.pptx")
+        worker_cls.return_value.finished.connect.assert_called_once_with(
+            manager._start_pending_load
+        )
+        worker_cls.return_value.start.assert_called_once()
+
     def test_file_watcher_notifies_on_change(self, tmp_path):
         """파일이 변경되면 SlideManager가 이를 감지하고 시그널을 보내야 함"""
         # Given: 실제 임시 파일 생성
@@ -76,3 +253,51 @@ class TestSlideManager:
             
         assert change_detected
         manager.stop_watching()
+
+
+class TestSlideUpdateHandler:
+    """파일 변경 이벤트 필터링 검증"""
+    
+    def test_touch_without_content_change_is_ignored(self, tmp_path):
+        """수정 시각만 바뀐 저장은 변경으로 보지 않아야 함"""
+        import os
+        from flow.services.slide_manager import SlideUpdateHandler
+        
+        pptx_file = tmp_path / "test.pptx"
+        pptx_file.write_bytes(b"content")
+        callback = MagicMock()
+        handler = SlideUpdateHandler(pptx_file, callback)
+        event = MagicMock(is_directory=False, src_path=str(pptx_file))
+        
+        os.utime(pptx_file)
+        handler.on_modified(event)
+        callback.assert_not_called()
+        
+        pptx_file.write_bytes(b"changed content")
+        handler.on_modified(event)
+        callback.assert_called_once()
+
+    def test_same_size_edit_with_large_central_directory_is_detected(self, tmp_path):
+        """중앙 디렉토리가 64KiB보다 커도 크기가 같은 수정을 변경으로 봐야 함"""
+        import zipfile
+
+        from flow.services.slide_manager import SlideUpdateHandler
+
+        def write_deck(body: bytes) -> None:
+            with zipfile.ZipFile(pptx_file, "w") as z:
+                for i in range(3000):
+                    name = f"ppt/slides/slide{i}.xml"
+                    info = zipfile.ZipInfo(name, (2020, 1, 1, 0, 0, 0))
+                    z.writestr(info, body)
+
+        pptx_file = tmp_path / "test.pptx"
+        write_deck(b"aaaa")
+        callback = MagicMock()
+        handler = SlideUpdateHandler(pptx_file, callback)
+        size = pptx_file.stat().st_size
+
+        write_deck(b"aaab")
+        assert pptx_file.stat().st_size == size
+        handler.on_modified(MagicMock(is_directory=False, src_path=str(pptx_file)))
+
+        callback.assert_called_once()
@@ -0,0 +1,96 @@
+"""DisplayWindow UI 테스트"""
+
+import pytest
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from flow.ui.display.display_window import DisplayWindow
+
+
+@pytest.fixture
+def app():
+    """QApplication 픽스처"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def window(app):
+    """DisplayWindow 픽스처"""
+    window = DisplayWindow()
+    window.resize(640, 360)
+    return window
+
+
+def test_show_image_reuses_scaled_pixmap(window):
+    """같은 이미지·크기로 다시 표시하면 변환/스케일을 반복하지 않아야 함"""
+    image = QImage(1280, 720, QImage.Format.Format_RGB32)
+    image.fill(0)
+
+    window.show_image(image)
+    key = window._scaled_key
+    cached = window._pixmap_cache[key]
+    window.show_image(image)
+
+    assert window._pixmap_cache[key] is cached
+    assert len(window._pixmap_cache) == 1
+    assert not window._lyric_label.pixmap().isNull()
+
+
+def test_show_image_after_lyric_restores_pixmap(window):
+    """가사 표시 후 같은 이미지를 다시 표시하면 이미지가 보여야 함"""
+    image = QImage(1280, 720, QImage.Format.Format_RGB32)
+    image.fill(0)
+
+    window.show_image(image)
+    window.show_lyric("가사")
+    window.show_image(image)
+
+    assert not window._lyric_label.pixmap().isNull()
+
+
+def test_background_mode_uses_palette(window):
+    """배경 모드 전환은 팔레트 색으로 반영되어야 함"""
+    from PySide6.QtGui import QColor, QPalette
+
+    window.set_background_mode(DisplayWindow.BG_CHROMA_GREEN)
+
+    assert window.palette().color(QPalette.ColorRole.Window) == QColor("#00FF00")
+    assert window.autoFillBackground()
+
+
+def test_resize_is_coalesced(window):
+    """연속 리사이즈는 보류되었다가 한 번만 반영되어야 함"""
+    from PySide6.QtTest import QTest
+
+    image = QImage(1280, 720, QImage.Format.Format_RGB32)
+    image.fill(0)
+    window.show()
+    window.show_image(image)
+
+    window.resize(800, 450)
+    window.resize(960, 540)
+    assert window._resize_pending
+
+    QTest.qWait(100)
+
+    assert not window._resize_pending
+    assert window._scaled_key[1] == int(960 * window.devicePixelRatioF())
+
+
+def test_revisited_slide_comes_from_cache(window):
+    """앞뒤로 넘긴 슬라이드는 다시 변환하지 않고 캐시에서 표시되어야 함"""
+    first = QImage(1280, 720, QImage.Format.Format_RGB32)
+    first.fill(0)
+    second = QImage(1280, 720, QImage.Format.Format_RGB32)
+    second.fill(0xFFFFFF)
+
+    window.show_image(first)
+    cached = window._pixmap_cache[window._scaled_key]
+    window.show_image(second)
+    window.show_image(first)
+
+    assert window._pixmap_cache[window._scaled_key] is cached
+    assert len(window._pixmap_cache) == 2
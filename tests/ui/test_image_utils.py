@@ -0,0 +1,29 @@
+"""이미지 스케일링 헬퍼 테스트"""
+
+import pytest
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+from flow.ui.image_utils import smart_scale
+
+
+@pytest.fixture
+def app():
+    """QApplication 픽스처"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.mark.parametrize("source", [QSize(8000, 4500), QSize(1280, 720)])
+def test_smart_scale_matches_direct_scale_size(app, source):
+    """큰 이미지든 작은 이미지든 결과 크기는 직접 스케일과 같아야 함"""
+    pixmap = QPixmap(source)
+    pixmap.fill(Qt.GlobalColor.black)
+    target = QSize(640, 480)
+
+    expected = pixmap.scaled(target, Qt.AspectRatioMode.KeepAspectRatio)
+
+    assert smart_scale(pixmap, target).size() == expected.size()
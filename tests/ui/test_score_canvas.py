@@ -0,0 +1,103 @@
+"""ScoreCanvas UI 테스트"""
+
+import pytest
+from PySide6.QtCore import QPoint
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from flow.domain.hotspot import Hotspot
+from flow.domain.score_sheet import ScoreSheet
+from flow.ui.editor.score_canvas import ScoreCanvas
+
+
+@pytest.fixture
+def app():
+    """QApplication 픽스처"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def canvas(app, tmp_path):
+    """1000x500 악보 이미지가 설정된 ScoreCanvas 픽스처"""
+    image_path = tmp_path / "score.png"
+    image = QImage(1000, 500, QImage.Format.Format_RGB32)
+    image.fill(0)
+    image.save(str(image_path))
+
+    canvas = ScoreCanvas()
+    canvas.resize(500, 500)
+    canvas.show()  # 보이는 위젯이어야 resizeEvent가 즉시 전달됨
+    canvas.set_score_sheet(ScoreSheet(name="곡1", image_path=str(image_path)))
+    return canvas
+
+
+def test_geometry_is_ready_without_paint(canvas):
+    """그리기 전에도 좌표 변환이 현재 크기 기준이어야 함"""
+    # 500x500 위젯에 1000x500 이미지: 0.5배, 위아래 125px 여백
+    assert canvas._widget_to_image_coords(250, 250) == (500, 250)
+    assert canvas._widget_to_image_coords(250, 100) is None
+
+
+def test_geometry_follows_resize(canvas):
+    """크기 변경 후 좌표 변환이 곧바로 갱신되어야 함"""
+    canvas.resize(1000, 500)
+
+    point = canvas._image_to_widget_coords(500, 250)
+
+    assert (point.x(), point.y()) == (500, 250)
+
+
+def test_find_hotspot_at_uses_click_radius(canvas):
+    """핫스팟 반경(+여유 8px) 안은 찾고, 밖은 찾지 않아야 함"""
+    hotspot = Hotspot(x=500, y=250)  # 위젯 좌표 (250, 250)
+    canvas._score_sheet.add_hotspot(hotspot)
+
+    assert canvas._find_hotspot_at(QPoint(260, 255)) is hotspot
+    assert canvas._find_hotspot_at(QPoint(280, 250)) is None
+
+
+def test_repaint_reuses_cached_frame(canvas):
+    """크기·악보가 그대로면 다시 그려도 배경 픽스맵을 재사용해야 함"""
+    canvas.grab()
+    frame = canvas._frame_pixmap
+    canvas.grab()
+
+    assert frame is not None
+    assert canvas._frame_pixmap is frame
+
+
+def test_hotspots_drawn_with_selection_style(canvas):
+    """일반 핫스팟은 주황, 선택된 핫스팟은 파랑으로 그려져야 함"""
+    normal = Hotspot(x=200, y=250)     # 위젯 좌표 (100, 250)
+    selected = Hotspot(x=500, y=250)   # 위젯 좌표 (250, 250)
+    canvas._score_sheet.add_hotspot(normal)
+    canvas._score_sheet.add_hotspot(selected)
+    canvas.select_hotspot(selected.id)
+
+    image = canvas.grab().toImage()
+
+    # 글자를 피해 원 아래쪽 가장자리 근처 픽셀 확인
+    normal_color = image.pixelColor(100, 261)
+    selected_color = image.pixelColor(250, 261)
+    assert normal_color.red() > normal_color.blue()
+    assert selected_color.blue() > selected_color.red()
+
+
+def test_hotspots_outside_update_rect_are_skipped(canvas):
+    """갱신 영역과 겹치지 않는 핫스팟은 그리지 않아야 함"""
+    from unittest.mock import MagicMock
+
+    from PySide6.QtCore import QRect
+
+    canvas._score_sheet.add_hotspot(Hotspot(x=500, y=250))  # 위젯 좌표 (250, 250)
+
+    painter = MagicMock()
+    canvas._draw_hotspots(painter, QRect(0, 0, 50, 50))
+    painter.drawPath.assert_not_called()
+
+    hotspot_rect = canvas._hotspot_rect(canvas._score_sheet.hotspots[0])
+    canvas._draw_hotspots(painter, hotspot_rect)
+    painter.drawPath.assert_called_once()